@@ -49,8 +49,10 @@ from typing import (
     Tuple,
     Optional,
     Union,
+    FrozenSet,
 )
 
+import io
 import re
 import struct
 from pathlib import Path
@@ -59,6 +61,7 @@ from operator import itemgetter
 
 import importlib.resources as importlib_resources
 import threading
+from functools import lru_cache
 
 
 INT32 = struct.Struct("<i")
@@ -214,7 +217,8 @@ def mark_to_set(mark: Union[str, Iterable[str]]) -> Set[str]:
     inflection category specifiers.
     """
     if isinstance(mark, str):
-        mark = set(mark.split("-"))
+        # Return a fresh copy of the cached set, since callers may modify it
+        return set(_mark_string_to_set(mark))
 
     atom_set: Set[str] = set()
     for at in mark:
@@ -258,6 +262,14 @@ def mark_to_set(mark: Union[str, Iterable[str]]) -> Set[str]:
     return atom_set.difference(IGNORED_VARIANTS)
 
 
+@lru_cache(maxsize=4096)
+def _mark_string_to_set(mark: str) -> FrozenSet[str]:
+    """Transform a mark string into a frozenset of inflection category
+    specifiers. The mark strings in BÍN are drawn from a small vocabulary,
+    and the same ones are parsed over and over, so the results are cached."""
+    return frozenset(mark_to_set(mark.split("-")))
+
+
 InflectionFilter = Callable[[str], bool]
 
 BinEntryTuple = Tuple[str, int, str, str, str, str]
@@ -562,11 +574,12 @@ class LineReader:
                 stream = open(self._fname, "rb")
             assert stream is not None
             with stream as inp:
-                # Read config file line-by-line from the package resources
+                # Read the config file in one go and convert it from utf-8
+                # to a Python string, then iterate over it line-by-line.
+                # Lines are only split at newlines, as in a binary file.
+                text = io.StringIO(inp.read().decode("utf-8"), newline="\n")
                 accumulator = ""
-                for b in inp:
-                    # We get byte strings; convert from utf-8 to Python strings
-                    s = b.decode("utf-8")
+                for s in text:
                     self._line += 1
                     if s.rstrip().endswith("\\"):
                         # Backslash at end of line: continuation in next line
@@ -233,3 +233,77 @@ UINT mapping(const BYTE* pbMap, const BYTE* pbWordLatin)
    return bc.mapping(pbWordLatin);
 }
 
+UINT dawg_contains(
+   const BYTE* pbDawg, UINT nRootOffset, const BYTE* pbWord, UINT nWordLen)
+{
+   /* Return 1 if the word is found in the packed DAWG whose root node
+      is at the given offset within the buffer, or 0 if not. The word
+      is encoded as a sequence of indices into the DAWG vocabulary.
+      The buffer layout is determined by the _BinaryDawgPacker class
+      in tools/dawgbuilder.py:
+      Node: BYTE (final flag | number of edges), followed by the edges
+      Edge: BYTE (prefix length), prefix bytes (encoded character, with
+         0x80 set if the prefix up to and including it is a final word),
+         and a UINT32 offset of the next node, unless the last prefix
+         byte has the 0x80 bit set, in which case there is no next node.
+   */
+   if (!nWordLen) {
+      return 0;
+   }
+   UINT nOffset = nRootOffset;
+   UINT nIndex = 0;
+   while (TRUE) {
+      UINT nNumEdges = pbDawg[nOffset++] & 0x7F;
+      BYTE chWord = pbWord[nIndex];
+      UINT nLen = 0;
+      const BYTE* pbPrefix = NULL;
+      // Find the outgoing edge whose prefix starts with the next
+      // character of the word (there is at most one such edge)
+      UINT nEdge;
+      for (nEdge = 0; nEdge < nNumEdges; nEdge++) {
+         nLen = pbDawg[nOffset] & 0x7F;
+         pbPrefix = pbDawg + nOffset + 1;
+         if ((pbPrefix[0] & 0x7F) == chWord) {
+            break;
+         }
+         // Skip past this edge
+         nOffset += 1 + nLen;
+         if (!(pbPrefix[nLen - 1] & 0x80)) {
+            nOffset += sizeof(UINT32);
+         }
+      }
+      if (nEdge >= nNumEdges) {
+         // No matching edge
+         return 0;
+      }
+      UINT32 nNextNode = 0;
+      if (!(pbPrefix[nLen - 1] & 0x80)) {
+         // The next node offset follows the prefix; it is not
+         // necessarily aligned, so we copy it rather than cast
+         memcpy(&nNextNode, pbPrefix + nLen, sizeof(UINT32));
+      }
+      // Match the word against the edge prefix
+      for (UINT j = 0; j < nLen; j++) {
+         if ((pbPrefix[j] & 0x7F) != pbWord[nIndex]) {
+            return 0;
+         }
+         if (++nIndex == nWordLen) {
+            // The word ends here: is this a final state?
+            if (pbPrefix[j] & 0x80) {
+               return 1;
+            }
+            if (j == nLen - 1 && nNextNode && (pbDawg[nNextNode] & 0x80)) {
+               // The next node is final
+               return 1;
+            }
+            return 0;
+         }
+      }
+      if (!nNextNode) {
+         // Letters left in the word, but nowhere to go
+         return 0;
+      }
+      nOffset = nNextNode;
+   }
+}
+
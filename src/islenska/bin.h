@@ -54,3 +54,7 @@ typedef uint8_t BYTE;
 // Map a word to an offset within the memory mapped buffer
 extern "C" UINT mapping(const BYTE* pbMap, const BYTE* pbWordLatin);
 
+// Return 1 if an encoded word is found in a packed DAWG buffer, or 0 if not
+extern "C" UINT dawg_contains(
+   const BYTE* pbDawg, UINT nRootOffset, const BYTE* pbWord, UINT nWordLen);
+
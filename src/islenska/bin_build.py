@@ -58,6 +58,9 @@ declarations = """
     typedef uint8_t BYTE;
 
     UINT mapping(const BYTE* pbMap, const BYTE* pszWordLatin);
+    UINT dawg_contains(
+        const BYTE* pbDawg, UINT nRootOffset, const BYTE* pbWord, UINT nWordLen
+    );
 
 """
 
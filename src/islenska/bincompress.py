@@ -75,6 +75,7 @@ from typing import (
     cast,
 )
 
+import sys
 import struct
 import functools
 import mmap
@@ -159,10 +160,12 @@ class BinCompressed:
         # Read the alphabet length
         alphabet_length = self._UINT(alphabet_offset)
         self._alphabet_bytes = bytes(self._b[alphabet_offset + 4 : alphabet_offset + 4 + alphabet_length])
-        # Decode the subcategories ('fl') into a list of strings
+        # Decode the subcategories ('fl') into a list of strings.
+        # The strings are interned so that comparisons with them,
+        # and with string literals, can short-circuit on identity.
         subcats_length = self._UINT(subcats_offset)
         subcats_bytes = bytes(self._b[subcats_offset + 4 : subcats_offset + 4 + subcats_length])
-        self._subcats = [s.decode("latin-1") for s in subcats_bytes.split()]
+        self._subcats = [sys.intern(s.decode("latin-1")) for s in subcats_bytes.split()]
         # Create a CFFI buffer object pointing to the memory map
         self._mmap_buffer: bytes = ffi.from_buffer(self._b)
         self._mmap_ptr: int = ffi.cast("uint8_t*", self._mmap_buffer)
@@ -201,7 +204,9 @@ class BinCompressed:
         assert self._b is not None
         b = bytes(self._b[off : off + 24])
         s = b.decode("latin-1").split(maxsplit=2)
-        return s[0], s[1]  # ofl, beyging
+        # Intern the strings, since the same few ofl and beyging values
+        # recur in a great many entries and are frequently compared
+        return sys.intern(s[0]), sys.intern(s[1])  # ofl, beyging
 
     def ksnid_string(self, ix: int) -> str:
         """Find and decode a KRISTINsnid string"""
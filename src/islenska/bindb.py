@@ -47,8 +47,8 @@ from typing import (
     Tuple,
     Iterable,
     Dict,
+    FrozenSet,
     Union,
-    cast,
     TypeVar,
 )
 from typing_extensions import Protocol
@@ -64,6 +64,7 @@ from .basics import (
     LFU_Cache,
     BinEntryTuple,
     make_bin_entry,
+    mark_to_set,
 )
 from .settings import (
     Settings,
@@ -115,6 +116,8 @@ CACHE_SIZE = 512
 # Cache size for most common lookup function
 # (entries matching a particular word form)
 CACHE_SIZE_MEANINGS = 4096
+# Cache size for the GreynirBin compatibility rewrite of entry fields
+CACHE_SIZE_ERRATA = 65536
 
 # The set of word subcategories (hluti) for person names
 # (i.e. first names or complete names)
@@ -129,6 +132,16 @@ _NOUNS = frozenset(("kk", "kvk", "hk"))
 
 _OPEN_CATS = frozenset(("so", "kk", "hk", "kvk", "lo"))  # Open word categories
 
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _category_set(category: str) -> FrozenSet[str]:
+    """Return a frozenset containing a single word category"""
+    if category == "no":
+        # Any noun
+        return _NOUNS
+    return frozenset((category,))
+
+
 # A dictionary of functions, one for each word category, that return
 # True for declension (mark) strings of canonical/lemma forms
 _LEMMA_FILTERS: Dict[str, InflectionFilter] = {
@@ -150,6 +163,14 @@ _LEMMA_FILTERS: Dict[str, InflectionFilter] = {
     "to": lambda b: b.startswith("KK_NF") or b == "OBEYGJANLEGT",
 }
 
+# Constructing BinEntry instances directly via tuple.__new__() skips the
+# overhead of the generated namedtuple constructor and of _make()
+_tuple_new = tuple.__new__
+
+# Separators between variant specifiers in Orð format specs,
+# such as 'þf_gr' or 'ÞF-gr'
+_VARIANT_SEPARATORS = re.compile(r"[-_]")
+
 # Word meanings that are marked in BÍN as obsolete, rare, errors or old;
 # these are sorted last in the lookup functions
 _LOW_PRIORITY_FORMS = frozenset(("URE", "SJALD", "VILLA", "GAM"))
@@ -165,6 +186,13 @@ class Bin:
     # Singleton LFU cache for word lookup
     _ksnid_cache: LFU_Cache[str, KsnidList] = LFU_Cache(maxsize=CACHE_SIZE_MEANINGS)
 
+    # Names of the lookup methods for the cases that _cast() casts to
+    _CASE_LOOKUPS: Dict[str, str] = {
+        "þf": "lookup_accusative",
+        "þgf": "lookup_dative",
+        "ef": "lookup_genitive",
+    }
+
     def __init__(self, **options: bool) -> None:
         """Initialize BIN database wrapper instance"""
         if self._bc is None:
@@ -234,7 +262,7 @@ class Bin:
         assert self._bc is not None
         max_utg = self._bc.begin_greynir_utg
         return [
-            BinEntry._make(mt)
+            _tuple_new(BinEntry, mt)
             for mt in mtlist
             # Only return entries with bin_id numbers below the Greynir-specific mark,
             # i.e. skip entries that are Greynir-specific
@@ -256,8 +284,10 @@ class Bin:
             if (k.bin_id < max_utg and k.birting != "G") or k.birting == "S"
         ]
         # Sort the result so that words with a non-normal correctness grade
-        # (i.e. not 1) are returned after those with a normal grade
-        m.sort(key=lambda k: int(k.einkunn != 1) + int(k.beinkunn != 1))
+        # (i.e. not 1) are returned after those with a normal grade.
+        # Single-entry lists, which are very common, need no sorting.
+        if len(m) > 1:
+            m.sort(key=lambda k: int(k.einkunn != 1) + int(k.beinkunn != 1))
         return m
 
     def _ksnid_lookup(self, w: str) -> KsnidList:
@@ -451,13 +481,12 @@ class Bin:
             # ending in 'legur'/'leg'/'legt'/'legir'/'legar' etc.
             llw = len(lower_w)
             m = []
-            for aend, mark in AdjectiveTemplate.ENDINGS:
-                if lower_w.endswith(aend) and llw > len(aend):
-                    prefix = lower_w[0 : llw - len(aend)]
-                    # Construct an adjective descriptor
-                    m.append(
-                        ctor(prefix + "legur", 0, "lo", "alm", lower_w, mark, None)
-                    )
+            for aend, mark in AdjectiveTemplate.matches(lower_w):
+                prefix = lower_w[0 : llw - len(aend)]
+                # Construct an adjective descriptor
+                m.append(
+                    ctor(prefix + "legur", 0, "lo", "alm", lower_w, mark, None)
+                )
             if lower_w.endswith("lega") and llw > 4:
                 # For words ending with "lega", add a possible adverb meaning
                 m.append(ctor(lower_w, 0, "ao", "alm", lower_w, "OBEYGJANLEGT", None))
@@ -514,15 +543,14 @@ class Bin:
 
         return w, m
 
-    @staticmethod
-    def _cast_to_case(
-        w: str,
-        lookup_func: TupleLookupFunc[BinEntry],
-        case_func: CaseFunc,
-        filter_func: Optional[BinFilterFunc],
-    ) -> str:
+    def _cast(self, w: str, case: str, filter_func: Optional[BinFilterFunc]) -> str:
         """Return a word after casting it from nominative to another case,
-        as returned by the case_func"""
+        given as 'þf', 'þgf' or 'ef'"""
+        # Note that since this function has no context, the conversion is
+        # by necessity simplistic; for instance it does not know whether
+        # an adjective is being used with an indefinite or definite noun,
+        # or whether a word such as 'við' is actually a preposition.
+        case_func: CaseFunc = getattr(self, self._CASE_LOOKUPS[case])
 
         def score(m: BinEntry) -> int:
             """Return a score for a noun word form, based on the
@@ -533,7 +561,7 @@ class Bin:
         mm: BinEntryList
 
         # Begin by looking up the word form
-        _, mm = lookup_func(w)
+        _, mm = self.lookup(w)
         if not mm:
             # Unknown word form: leave it as-is
             return w
@@ -737,6 +765,7 @@ class Bin:
         # This is done for consistency, as some middle voice verbs have
         # their own separate lemmas in BÍN, such as 'ábyrgjast'.
         final_w, entries = self.lookup(lemma)
+        lemma_filter = _LEMMA_FILTERS.get
 
         def match(m: BinEntry) -> bool:
             """Return True for entries that are canonical as lemmas"""
@@ -747,8 +776,10 @@ class Bin:
             if m.ord.replace("-", "") != final_w:
                 # This lemma does not agree with the passed-in word
                 return False
-            # Do a check of the canonical lemma inflection forms
-            return _LEMMA_FILTERS.get(m.ofl, lambda _: True)(m.mark)
+            # Do a check of the canonical lemma inflection forms,
+            # if there is such a check for this category
+            f = lemma_filter(m.ofl)
+            return True if f is None else f(m.mark)
 
         return final_w, [m for m in entries if match(m)]
 
@@ -793,48 +824,21 @@ class Bin:
     ) -> str:
         """Cast a word from nominative to accusative case, or return it
         unchanged if it is not inflectable by case."""
-        # Note that since this function has no context, the conversion is
-        # by necessity simplistic; for instance it does not know whether
-        # an adjective is being used with an indefinite or definite noun,
-        # or whether a word such as 'við' is actually a preposition.
-        return self._cast_to_case(
-            w,
-            self.lookup,
-            self.lookup_accusative,
-            filter_func=filter_func,
-        )
+        return self._cast(w, "þf", filter_func)
 
     def cast_to_dative(
         self, w: str, *, filter_func: Optional[BinFilterFunc] = None
     ) -> str:
         """Cast a word from nominative to dative case, or return it
         unchanged if it is not inflectable by case."""
-        # Note that since this function has no context, the conversion is
-        # by necessity simplistic; for instance it does not know whether
-        # an adjective is being used with an indefinite or definite noun,
-        # or whether a word such as 'við' is actually a preposition.
-        return self._cast_to_case(
-            w,
-            self.lookup,
-            self.lookup_dative,
-            filter_func=filter_func,
-        )
+        return self._cast(w, "þgf", filter_func)
 
     def cast_to_genitive(
         self, w: str, *, filter_func: Optional[BinFilterFunc] = None
     ) -> str:
         """Cast a word from nominative to genitive case, or return it
         unchanged if it is not inflectable by case."""
-        # Note that since this function has no context, the conversion is
-        # by necessity simplistic; for instance it does not know whether
-        # an adjective is being used with an indefinite or definite noun,
-        # or whether a word such as 'við' is actually a preposition.
-        return self._cast_to_case(
-            w,
-            self.lookup,
-            self.lookup_genitive,
-            filter_func=filter_func,
-        )
+        return self._cast(w, "ef", filter_func)
 
     def get_compound(
         self, w: str, at_sentence_start: bool = False
@@ -849,6 +853,50 @@ class Bin:
         return w, m
 
 
+@lru_cache(maxsize=CACHE_SIZE_ERRATA)
+def _apply_errata(
+    ord: str, ofl: str, hluti: str, mark: str
+) -> Optional[Tuple[str, str, str]]:
+    """Adapt the ofl, hluti and mark fields of a BÍN entry for compatibility
+    with previous versions of BÍN, as used in Greynir, and apply BÍN errata.
+    Returns an (ofl, hluti, mark) tuple, or None if the entry is marked
+    for deletion. The result only depends on the parameters and on the
+    (static) errata and deletions loaded by GreynirBin, so it is cached."""
+    errata = GreynirBin.bin_errata
+    assert errata is not None
+    if (ord, ofl, hluti) in GreynirBin.bin_deletions:
+        # The (ord, ofl, hluti) combination is marked
+        # for deletion in BinErrata.conf
+        return None
+    # Convert uninflectable indicator to "-" for compatibility
+    if mark == "OBEYGJANLEGT":
+        mark = "-"
+        if ofl == "to":
+            # Convert uninflectable number words to "töl" for compatibility
+            ofl = "töl"
+    # Convert "afn" (reflexive pronoun) to "abfn" for compatibility
+    if ofl == "afn":
+        ofl = "abfn"
+    # Convert "rt" (ordinal number) to "lo" (adjective)
+    # for compatibility
+    elif ofl == "rt":
+        ofl = "lo"
+    # Apply a fix if we have one for this particular (lemma, ofl) combination
+    if ord in GreynirBin.bin_errata_ords:
+        hluti = errata.get((ord, ofl), hluti)
+    return ofl, hluti, mark
+
+
+@lru_cache(maxsize=None)  # The set of verb marks is small and fixed
+def _verb_priority(mark: str) -> int:
+    """Return the additional priority of a verb form, given its mark.
+    This is computed once per distinct mark and then cached."""
+    # Order "VH" verbs (viðtengingarháttur) after other forms
+    # Also order past tense ("ÞT") after present tense
+    # plural after singular and 2p after 3p
+    return 4 * ("VH" in mark) + 2 * ("ÞT" in mark) + ("FT" in mark) + ("2P" in mark)
+
+
 class GreynirBin(Bin):
 
     """Overridden class for use by GreynirPackage, including
@@ -861,6 +909,9 @@ class GreynirBin(Bin):
 
     # A dictionary of BÍN errata, loaded from BinErrata.conf
     bin_errata: Optional[Dict[Tuple[str, str], str]] = None
+    # The set of lemmas that occur in the errata dictionary, allowing
+    # a quick check before a (lemma, ofl) lookup in it
+    bin_errata_ords: Set[str] = set()
     # A set of BÍN deletions, loaded from BinErrata.conf
     bin_deletions: Set[Tuple[str, str, str]] = set()
 
@@ -870,7 +921,10 @@ class GreynirBin(Bin):
             config_file = str(Path("config", "BinErrata.conf"))
             Settings.read(config_file, force=True)
             GreynirBin.bin_deletions = BinDeletions.SET
+            GreynirBin.bin_errata_ords = set(lemma for lemma, _ in BinErrata.DICT)
             GreynirBin.bin_errata = BinErrata.DICT
+            # Discard any cached results computed from previous errata
+            _apply_errata.cache_clear()
 
     def _filter_meanings(self, mtlist: Iterable[BinEntryTuple]) -> BinEntryList:
         """Override the default straight-through translation of
@@ -878,30 +932,15 @@ class GreynirBin(Bin):
         returned from Bin/GreynirBin"""
         result: BinEntryList = []
         for mt in mtlist:
-            if (mt[0], mt[2], mt[3]) in self.bin_deletions:
-                # The (ord, ofl, hluti) combination is marked
-                # for deletion in BinErrata.conf:
+            # mt: [0]=ord, [1]=bin_id, [2]=ofl, [3]=hluti, [4]=bmynd, [5]=mark
+            t = _apply_errata(mt[0], mt[2], mt[3], mt[5])
+            if t is None:
                 # This meaning is not visible to Greynir
                 continue
-            m: List[Union[str, int]] = list(mt)
-            # ml: [0]=ord, [1]=bin_id, [2]=ofl, [3]=hluti, [4]=bmynd, [5]=mark
-            # Convert uninflectable indicator to "-" for compatibility
-            if mt[5] == "OBEYGJANLEGT":
-                m[5] = "-"
-                if mt[2] == "to":
-                    # Convert uninflectable number words to "töl" for compatibility
-                    m[2] = "töl"
-            # Convert "afn" (reflexive pronoun) to "abfn" for compatibility
-            if mt[2] == "afn":
-                m[2] = "abfn"
-            # Convert "rt" (ordinal number) to "lo" (adjective)
-            # for compatibility
-            elif mt[2] == "rt":
-                m[2] = "lo"
-            # Apply a fix if we have one for this particular (lemma, ofl) combination
-            assert self.bin_errata is not None
-            m[3] = self.bin_errata.get((mt[0], cast(str, m[2])), mt[3])
-            result.append(BinEntry._make(m))
+            ofl, hluti, mark = t
+            result.append(
+                _tuple_new(BinEntry, (mt[0], mt[1], ofl, hluti, mt[4], mark))
+            )
         return result
 
     def _filter_ksnid(self, klist: Iterable[Ksnid]) -> KsnidList:
@@ -909,27 +948,11 @@ class GreynirBin(Bin):
         for compatibility with previous versions of BÍN, as used in Greynir"""
         result: KsnidList = []
         for k in klist:
-            if (k.ord, k.ofl, k.hluti) in self.bin_deletions:
-                # The (ord, ofl, hluti) combination is marked
-                # for deletion in BinErrata.conf:
+            t = _apply_errata(k.ord, k.ofl, k.hluti, k.mark)
+            if t is None:
                 # This meaning is not visible to Greynir
                 continue
-            # Convert uninflectable indicator to "-" for compatibility
-            if k.mark == "OBEYGJANLEGT":
-                k.mark = "-"
-                if k.ofl == "to":
-                    # Convert uninflectable number words to "töl" for compatibility
-                    k.ofl = "töl"
-            # Convert "afn" (reflexive pronoun) to "abfn" for compatibility
-            if k.ofl == "afn":
-                k.ofl = "abfn"
-            # Convert "rt" (ordinal number) to "lo" (adjective)
-            # for compatibility
-            elif k.ofl == "rt":
-                k.ofl = "lo"
-            # Apply a fix if we have one for this particular (lemma, ofl) combination
-            assert self.bin_errata is not None
-            k.hluti = self.bin_errata.get((k.ord, k.ofl), k.hluti)
+            k.ofl, k.hluti, k.mark = t
             result.append(k)
         return result
 
@@ -939,28 +962,22 @@ class GreynirBin(Bin):
         in m. A lower number means more priority, a higher number
         means less priority. The final list of meanings is sorted
         so that higher-priority meanings occur before lower-priority ones."""
+        # Note: booleans are added directly as integers, without int() calls
         prio = (
             # +1 if bin_id is 0 (constructed word form, not originally in BÍN)
             # +1 if einkunn (grammatical correctness grade) is not 1 (normal)
             # +1 if malsnid (lemma semantic category) is a low priority category
             # +1 if bmalsnid (word semantic category) is a low priority category
-            int(m.bin_id == 0)
-            + int(m.einkunn != 1)
-            + int(m.malsnid in _LOW_PRIORITY_FORMS)
-            + int(m.bmalsnid in _LOW_PRIORITY_FORMS)
+            (m.bin_id == 0)
+            + (m.einkunn != 1)
+            + (m.malsnid in _LOW_PRIORITY_FORMS)
+            + (m.bmalsnid in _LOW_PRIORITY_FORMS)
         )
         if m.ofl != "so":
             # Not a verb: Prioritize forms by general acceptability only
             return prio
-        # Verb priorities
-        # Order "VH" verbs (viðtengingarháttur) after other forms
-        # Also order past tense ("ÞT") after present tense
-        # plural after singular and 2p after 3p
-        prio += 4 if "VH" in m.mark else 0
-        prio += 2 if "ÞT" in m.mark else 0
-        prio += 1 if "FT" in m.mark else 0
-        prio += 1 if "2P" in m.mark else 0
-        return prio
+        # Verb priorities, which only depend on the mark
+        return prio + _verb_priority(m.mark)
 
     def _ksnid_lookup(self, w: str) -> KsnidList:
         """Override the Bin _ksnid_lookup() function to order the
@@ -979,7 +996,8 @@ class GreynirBin(Bin):
         # Order the returned entries by priority, so that the most
         # common/likely ones are first in the list and thus
         # matched more readily than the less common ones
-        m.sort(key=self._priority)
+        if len(m) > 1:
+            m.sort(key=self._priority)
         return m
 
 
@@ -988,8 +1006,26 @@ class Orð:
     """Encapsulates an Icelandic word along with its matching vocabulary entries,
     allowing easy generation of inflectional variants via a __format__() method"""
 
+    __slots__ = (
+        "_word",
+        "_is_upper",
+        "_title",
+        "_key",
+        "_m",
+        "_ksnid",
+    )
+
     _b: Optional[GreynirBin] = None
 
+    # Cache of inflectional variants, shared by all Orð instances.
+    # It is keyed by (word, ofl, bin_id, set of casefolded variant specifiers),
+    # so that equivalent format specs (such as 'þf_gr' and 'ÞF-gr')
+    # share a cache entry, as do separately constructed instances
+    # of the same word.
+    _variants_cache: LFU_Cache[
+        Tuple[str, str, int, FrozenSet[str]], KsnidList
+    ] = LFU_Cache(maxsize=CACHE_SIZE_MEANINGS)
+
     def __init__(
         self,
         word: str,
@@ -999,23 +1035,34 @@ class Orð:
         if self._b is None:
             Orð._b = GreynirBin()
         assert self._b is not None
-        self._word = word
+        self._set_word(word)
         self._key, self._m = self._b.lookup_ksnid(word, at_sentence_start)
         if category is not None:
-            if category == "no":
-                # Any noun
-                cat_set = frozenset(("kk", "kvk", "hk"))
-            else:
-                cat_set = frozenset(
-                    [category] if isinstance(category, str) else category
-                )
+            cat_set = (
+                _category_set(category)
+                if isinstance(category, str)
+                else frozenset(category)
+            )
             self._m = [mm for mm in self._m if mm.ofl in cat_set]
         self._ksnid: Optional[Ksnid] = self._m[0] if self._m else None
 
+    def _set_word(self, word: str) -> None:
+        """Initialize the attributes that depend only on the original word"""
+        self._word = word
+        # The case of the original word is emulated in every inflected
+        # variant, so we determine it once and for all here
+        self._is_upper = word.isupper()
+        self._title = not self._is_upper and word[:1].isupper()
+
     @classmethod
     def from_ksnid(cls, ksnid: Ksnid) -> "Orð":
-        """Hacky constructor to create an Orð instance from a Ksnid instance"""
-        o = cls(ksnid.bmynd, ksnid.ofl)
+        """Hacky constructor to create an Orð instance from a Ksnid instance.
+        The Ksnid instance is used as-is, without another BÍN lookup."""
+        if cls._b is None:
+            Orð._b = GreynirBin()
+        o = cls.__new__(cls)
+        o._set_word(ksnid.bmynd)
+        o._key = ksnid.bmynd
         o._m = [ksnid]
         o._ksnid = ksnid
         return o
@@ -1066,17 +1113,39 @@ class Orð:
         """Return the BÍN identifier, or zero if not present in BÍN"""
         return self._ksnid.bin_id if self._ksnid else 0
 
+    def form(self, spec: str) -> str:
+        """Return the inflectional variant of the word given by a
+        specification such as 'þf_gr' or 'ÞF-FT-nogr'. This is the
+        same as formatting the word with the specification in an
+        f-string, but may be called once outside of a loop."""
+        if self._ksnid is None or not spec:
+            # Not found in BÍN or no specification: can't inflect
+            return self.word
+        return self._inflect(spec)
+
     def __format__(self, format_spec: str) -> str:
         """Return a requested inflectional variant of the word"""
-        if self._ksnid is None or not format_spec:
-            # Not found in BÍN or no format specification: can't inflect
-            return self.word
+        return self.form(format_spec)
+
+    def _inflect(self, format_spec: str) -> str:
+        """Look up the inflectional variant given by a format spec"""
         # We allow both hyphen and underscore as variant separators
-        to_inflection = tuple(f.strip() for f in re.split(r"[-_]", format_spec))
+        to_inflection = tuple(
+            f.strip() for f in _VARIANT_SEPARATORS.split(format_spec)
+        )
+        # Validate the spec up front: this raises ValueError on
+        # unknown features before any cache or database lookup.
+        # Joining the features into a mark string lets mark_to_set()
+        # use its cache of parsed mark strings.
+        tags = frozenset(mark_to_set("-".join(to_inflection)))
         bin_id = self.bin_id
-        assert self._b is not None
-        # Look up the inflectional variant(s)
-        v = self._b.lookup_variants(self.word, self.ofl, to_inflection, bin_id=bin_id)
+        b = self._b
+        assert b is not None
+        # Look up the inflectional variant(s), unless we already have them
+        key = (self.word, self.ofl, bin_id, tags)
+        v = self._variants_cache.lookup(
+            key, lambda k: b.lookup_variants(k[0], k[1], k[3], bin_id=k[2])
+        )
         if not v:
             # No such variants: return the original word
             return self.word
@@ -1085,8 +1154,8 @@ class Orð:
         if bin_id == 0:
             # Probably a word created by the compounder: delete the inserted hyphens
             w = w.replace("-", "")
-        if self.word.isupper():
+        if self._is_upper:
             return w.upper()
-        if self.word[0].isupper():
+        if self._title:
             return w[0].upper() + w[1:]
         return w.lower()
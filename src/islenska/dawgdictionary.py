@@ -39,7 +39,7 @@
 
 """
 
-from typing import Dict, List, Optional, Union, Tuple, Iterator, ItemsView, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Iterator, cast
 
 import os
 import threading
@@ -48,8 +48,28 @@ import mmap
 
 import importlib.resources as importlib_resources
 
+from typing_extensions import Protocol
+
+# Import the CFFI wrapper for the bin.cpp C++ module (see also build_bin.py)
+# pylint: disable=no-name-in-module
+from ._bin import lib as lib_unknown, ffi as ffi_unknown  # type: ignore
+
+# Go through shenanigans to satisfy Pylance/Mypy
+bin_cffi = cast(Any, lib_unknown)
+ffi = cast(Any, ffi_unknown)
+
 _PATH = os.path.dirname(__file__) or "."
 
+# Maximum number of cached membership test results per DAWG
+CONTAINS_CACHE_SIZE = 100000
+
+# The parsed edges of a DAWG node: the first characters of the edges,
+# as a string, followed by tuples with the prefix string, the final
+# position bit mask and the next node offset (or 0 if none) of each edge.
+# Bit j of a final position mask is set if the matched string up to and
+# including prefix[j] is a complete word.
+DawgNode = Tuple[str, Tuple[str, ...], Tuple[int, ...], Tuple[int, ...]]
+
 
 class Wordbase:
     """Container for a singleton instance of the word database"""
@@ -82,66 +102,165 @@ class Wordbase:
     @classmethod
     def dawg(cls) -> "PackedDawgDictionary":
         """Load the combined dictionary"""
-        with cls._lock:
-            if cls._dawg_all is None:
-                cls._dawg_all = Wordbase._load_resource("ordalisti-all")
-            assert cls._dawg_all is not None
-            return cls._dawg_all
+        # Once loaded, the dictionary never changes, so we only
+        # acquire the lock if it has not been loaded yet
+        dawg = cls._dawg_all
+        if dawg is None:
+            with cls._lock:
+                dawg = cls._dawg_all
+                if dawg is None:
+                    dawg = Wordbase._load_resource("ordalisti-all")
+                    cls._dawg_all = dawg
+        return dawg
 
     @classmethod
     def dawg_prefixes(cls) -> "PackedDawgDictionary":
         """Load the dictionary of words allowed as prefixes
         in a compound word (i.e. can occur in any part except
         the last part of the compound word)"""
-        with cls._lock:
-            if cls._dawg_prefixes is None:
-                cls._dawg_prefixes = Wordbase._load_resource("ordalisti-prefixes")
-            assert cls._dawg_prefixes is not None
-            return cls._dawg_prefixes
+        dawg = cls._dawg_prefixes
+        if dawg is None:
+            with cls._lock:
+                dawg = cls._dawg_prefixes
+                if dawg is None:
+                    dawg = Wordbase._load_resource("ordalisti-prefixes")
+                    cls._dawg_prefixes = dawg
+        return dawg
 
     @classmethod
     def dawg_suffixes(cls) -> "PackedDawgDictionary":
         """Load the dictionary of words that are allowed as the last
         part of a compound word"""
-        with cls._lock:
-            if cls._dawg_suffixes is None:
-                cls._dawg_suffixes = Wordbase._load_resource("ordalisti-suffixes")
-            assert cls._dawg_suffixes is not None
-            return cls._dawg_suffixes
+        dawg = cls._dawg_suffixes
+        if dawg is None:
+            with cls._lock:
+                dawg = cls._dawg_suffixes
+                if dawg is None:
+                    dawg = Wordbase._load_resource("ordalisti-suffixes")
+                    cls._dawg_suffixes = dawg
+        return dawg
 
     @classmethod
     def slice_compound_word(cls, word: str) -> List[str]:
         """Get best combination of word parts if such a combination exists"""
-        # We get back a list of lists, i.e. all possible compound word combinations
-        # where each combination is a list of word parts.
-        w = cls.dawg().find_combinations(word)
-        if w:
-            # Sort by (1) longest last part and (2) the lowest overall number of parts
-            w.sort(key=lambda x: (len(x[-1]), -len(x)), reverse=True)
-            prefixes = cls.dawg_prefixes()
-            suffixes = cls.dawg_suffixes()
-            # Loop over the sorted combinations until we find a legal one,
-            # i.e. where the suffix is a legal suffix and all prefixes are
-            # legal prefixes
-            for combination in w:
-                if combination[-1] in suffixes and all(c in prefixes for c in combination[0:-1]):
-                    # Valid combination: return it
-                    return combination
+        # The best combination is the one with (1) the longest last part and
+        # (2) the lowest overall number of parts, where the last part is a legal
+        # suffix and all other parts are legal prefixes. The combinations
+        # considered are those returned by find_combinations() on the combined
+        # dictionary, and both build on its part_ends(). Instead of generating
+        # all combinations and then sorting and filtering them, we try the
+        # possible last parts in order of decreasing length, and for each one
+        # look for the shortest sequence of legal prefixes that leads up to it.
+        # The first hit is the best combination.
+        prefixes = cls.dawg_prefixes()
+        suffixes = cls.dawg_suffixes()
+        lw = len(word)
+        parts = cls.dawg().part_ends(word)
+        # The last part can start wherever the rest of the word is a word
+        # in itself. The start indices are in ascending order, i.e. the
+        # last parts are in order of decreasing length.
+        lasts = [start for start, ends in parts.items() if ends == [lw]]
+        # Try the last parts in order of decreasing length
+        for last in lasts:
+            if word[last:] not in suffixes:
+                continue
+            # The shortest sequence of prefix end indices leading from
+            # a given index to the last part, or None if there is none
+            chain_memo: Dict[int, Optional[List[int]]] = {last: []}
+
+            def chain(start: int) -> Optional[List[int]]:
+                if start in chain_memo:
+                    return chain_memo[start]
+                best: Optional[List[int]] = None
+                for end in parts[start]:
+                    if end > last:
+                        break
+                    if best is not None and len(best) == 1:
+                        # Can't do better than a single prefix
+                        break
+                    if word[start:end] not in prefixes:
+                        continue
+                    tail = chain(end)
+                    # Of two equally short sequences, the first one found
+                    # wins, as in the order of find_combinations()
+                    if tail is not None and (best is None or len(tail) + 1 < len(best)):
+                        best = [end] + tail
+                chain_memo[start] = best
+                return best
+
+            c = chain(0)
+            if c is not None:
+                # Valid combination: return it
+                bounds = [0] + c
+                return [word[i:j] for i, j in zip(bounds, c)] + [word[last:]]
         # No legal combination found
         return []
 
 
+class Navigator(Protocol):
+    """The interface of a navigation object, as used by
+    PackedDawgDictionary.navigate()"""
+
+    def push_edge(self, firstchar: str) -> bool:
+        ...
+
+    def accepting(self) -> bool:
+        ...
+
+    def accepts(self, newchar: str) -> bool:
+        ...
+
+    def accept(self, matched: str, final: bool) -> None:
+        ...
+
+    def pop_edge(self) -> bool:
+        ...
+
+
+class SingleEdgeNavigator(Navigator, Protocol):
+    """A navigator that matches a single given word, and can therefore
+    be navigated along a direct path through the DAWG. A navigator
+    opts into this by setting its single_edge attribute to True,
+    thereby promising that:
+
+    - push_edge() only ever accepts the edge that starts with next_char();
+    - pop_edge() always returns False;
+    - accept() ignores non-final matches;
+    - matched() returns the part of the word that has been accepted.
+
+    A subclass that changes any of this should set single_edge to False."""
+
+    single_edge: bool
+
+    def next_char(self) -> str:
+        ...
+
+    def matched(self) -> str:
+        ...
+
+
 class FindNavigator:
     """A navigation class to be used with DawgDictionary.navigate()
     to find a particular word in the dictionary by exact match
     """
 
+    # See SingleEdgeNavigator
+    single_edge = True
+
     def __init__(self, word: str) -> None:
         self._word = word
         self._len = len(word)
         self._index = 0
         self._found = False
 
+    def next_char(self) -> str:
+        """Returns the only character that push_edge() accepts"""
+        return self._word[self._index]
+
+    def matched(self) -> str:
+        """Returns the part of the word that has been matched so far"""
+        return self._word[: self._index]
+
     def push_edge(self, firstchar: str) -> bool:
         """Returns True if the edge should be entered or False if not"""
         # Enter the edge if it fits where we are in the word
@@ -181,8 +300,13 @@ class CompoundNavigator:
     """A navigation class to be used with DawgDictionary.navigate()
     to find all possible compositions of shorter words that
     together form a long (compound) word.
+    Note: PackedDawgDictionary.find_combinations() no longer uses this
+    class; it is retained for backwards compatibility.
     """
 
+    # See SingleEdgeNavigator
+    single_edge = True
+
     def __init__(self, dawg: "PackedDawgDictionary", word: str) -> None:
         self._dawg = dawg
         self._word = word
@@ -190,6 +314,14 @@ class CompoundNavigator:
         self._index = 0
         self._parts: List[List[str]] = []
 
+    def next_char(self) -> str:
+        """Returns the only character that push_edge() accepts"""
+        return self._word[self._index]
+
+    def matched(self) -> str:
+        """Returns the part of the word that has been matched so far"""
+        return self._word[: self._index]
+
     def push_edge(self, firstchar: str) -> bool:
         """Returns True if the edge should be entered or False if not"""
         # Follow all edges that match a letter in the compound word
@@ -236,12 +368,30 @@ class PackedDawgDictionary:
     """Encapsulates a DAWG dictionary that is initialized from a packed
     binary file on disk and navigated as a byte buffer."""
 
+    # The structure used to decode an edge offset from bytes
+    _UINT32 = struct.Struct("<L")
+
     def __init__(self) -> None:
         # The packed byte buffer
         self._b: Optional[mmap.mmap] = None
         self._vocabulary: Optional[str] = None
         self._root_offset = 0
-        self._encoding: Dict[int, str] = dict()
+        self._encoding: Tuple[str, ...] = ()
+        # Translation table from vocabulary characters to encoded indices
+        self._translation: Dict[int, int] = dict()
+        # CFFI buffer and pointer for the C++ lookup function
+        self._mmap_buffer: Any = None
+        self._mmap_ptr: Any = None
+        # Cached results of membership tests
+        self._contains_cache: Dict[str, bool] = dict()
+        # Parsed nodes, keyed by offset in the byte buffer. Nodes are
+        # parsed lazily, the first time that they are visited.
+        self._nodes: Dict[int, DawgNode] = dict()
+        # The same prefix strings occur on a great many edges, as do the
+        # same sets of first characters on many nodes. Only one string
+        # object is kept for each distinct value, which reduces the memory
+        # footprint of the parsed nodes to a fraction.
+        self._strings: Dict[str, str] = dict()
 
     def load(self, fname: str) -> None:
         """Load a packed DAWG from a binary file"""
@@ -257,10 +407,22 @@ class PackedDawgDictionary:
         (len_voc,) = struct.Struct("<L").unpack_from(self._b, 12)
         self._vocabulary = self._b[16 : 16 + len_voc].decode("utf-8")
         self._root_offset = 16 + len_voc
-        # Assemble a decoding dictionary where encoded indices are mapped to
-        # characters, eventually with a suffixed vertical bar '|' to denote finality
-        self._encoding = {i: c for i, c in enumerate(self._vocabulary)}
-        self._encoding.update({i | 0x80: c + "|" for i, c in enumerate(self._vocabulary)})
+        # Assemble a decoding table where encoded indices are mapped to
+        # characters, regardless of the high bit that denotes finality.
+        # The table is a flat tuple indexed by byte value, usable as a
+        # str.translate() table for the Latin-1 decoded bytes of a prefix
+        encoding = [""] * 256
+        for i, c in enumerate(self._vocabulary):
+            encoding[i] = c
+            encoding[i | 0x80] = c
+        self._encoding = tuple(encoding)
+        # Map vocabulary characters to their indices, making sure that other
+        # characters with low code points are not mistaken for indices
+        self._translation = {i: 0x7F for i in range(len(self._vocabulary))}
+        self._translation.update({ord(c): i for i, c in enumerate(self._vocabulary)})
+        # Create a CFFI buffer object pointing to the memory map
+        self._mmap_buffer = ffi.from_buffer(self._b)
+        self._mmap_ptr = ffi.cast("uint8_t*", self._mmap_buffer)
 
     def find(self, word: str) -> bool:
         """Look for a word in the graph, returning True
@@ -269,18 +431,77 @@ class PackedDawgDictionary:
 
     def __contains__(self, word: str) -> bool:
         """Enable simple lookup syntax: "word" in dawgdict"""
-        nav = FindNavigator(word)
-        self.navigate(nav)
-        return nav.is_found()
+        cache = self._contains_cache
+        found = cache.get(word)
+        if found is None:
+            found = self._lookup(word)
+            if len(cache) >= CONTAINS_CACHE_SIZE:
+                # Simple size control: start over with an empty cache
+                cache.clear()
+            cache[word] = found
+        return found
+
+    def _lookup(self, word: str) -> bool:
+        """Look up a word in the DAWG, without caching"""
+        # The lookup itself is done in C++, on the word encoded
+        # as a sequence of indices into the DAWG vocabulary
+        try:
+            b = word.translate(self._translation).encode("latin-1")
+        except UnicodeEncodeError:
+            # Not representable in the vocabulary: can't be in the DAWG
+            return False
+        if not b or max(b) >= 0x7F:
+            # Empty word, or contains characters that can't be encoded
+            # (other characters outside the vocabulary simply won't match)
+            return False
+        return bool(bin_cffi.dawg_contains(self._mmap_ptr, self._root_offset, b, len(b)))
 
-    def find_combinations(self, word: str):
+    def find_combinations(self, word: str) -> List[List[str]]:
         """Attempt to slice an unknown word into parts, where each part is
         a valid word form in itself, and the parts form a valid compound word."""
-        nav = CompoundNavigator(self, word)
-        self.navigate(nav)
-        return nav.result()
-
-    def navigate(self, nav: Union[FindNavigator, CompoundNavigator]) -> None:
+        if not word:
+            return []
+        parts = self.part_ends(word)
+        # The combinations for each suffix of the word, keyed by its start index.
+        # Many prefixes can end at the same index, so this avoids combining
+        # the same suffix over and over again.
+        memo: Dict[int, List[List[str]]] = {len(word): [[]]}
+
+        def combinations(start: int) -> List[List[str]]:
+            """Return all combinations of parts that make up word[start:]"""
+            result = memo.get(start)
+            if result is None:
+                result = memo[start] = [
+                    [word[start:end]] + tail
+                    for end in parts[start]
+                    for tail in combinations(end)
+                ]
+            return result
+
+        return combinations(0)
+
+    def part_ends(self, word: str) -> Dict[int, List[int]]:
+        """Map each index where a part of a compound word can start, i.e.
+        each index that can be reached from the start of the word by a
+        sequence of words, to the end indices of the words that start there.
+        If the rest of the word from an index is a word in itself, it is
+        the last part and is not split any further: the end indices for
+        that index are then only [len(word)]."""
+        lw = len(word)
+        parts: Dict[int, List[int]] = dict()
+        reachable = [False] * (lw + 1)
+        reachable[0] = True
+        for start in range(lw):
+            if reachable[start]:
+                ends = self.all_final_prefixes(word, start)
+                if ends and ends[-1] == lw:
+                    ends = [lw]
+                for end in ends:
+                    reachable[end] = True
+                parts[start] = ends
+        return parts
+
+    def navigate(self, nav: Navigator) -> None:
         """A generic function to navigate through the DAWG under
         the control of a navigation object.
 
@@ -298,92 +519,168 @@ class PackedDawgDictionary:
         def pop_edge()
             called when leaving an edge that has been navigated; returns False
             if there is no need to visit other edges
+
+        Navigators that match a single word can opt into a faster
+        navigation by setting single_edge to True (see SingleEdgeNavigator).
         """
+        PackedNavigation(nav, self._node, self._root_offset).go()
+
+    def all_final_prefixes(self, word: str, start: int = 0) -> List[int]:
+        """Return the end indices of all prefixes of word[start:] that are
+        words in the DAWG, in ascending order"""
+        ends: List[int] = []
+        lw = len(word)
+        i = start
+        offset = self._root_offset
+        # There is at most one edge to follow out of each node:
+        # the one that starts with the next character of the word
+        while i < lw:
+            first_chars, prefixes, finals, nextnodes = self._node(offset)
+            k = first_chars.find(word[i])
+            if k < 0:
+                break
+            final_mask = finals[k]
+            for c in prefixes[k]:
+                if i >= lw or word[i] != c:
+                    # The word ends or diverges within this edge
+                    return ends
+                i += 1
+                if final_mask & 1:
+                    ends.append(i)
+                final_mask >>= 1
+            offset = nextnodes[k]
+            if not offset:
+                break
+        return ends
+
+    def _node(self, offset: int) -> DawgNode:
+        """Return the parsed edges of the node at the given offset
+        in the byte buffer, parsing the node if this is the first visit"""
+        node = self._nodes.get(offset)
+        if node is None:
+            shared = self._strings.setdefault
+            prefixes: List[str] = []
+            finals: List[int] = []
+            nextnodes: List[int] = []
+            for prefix, final_mask, nextnode in self._iter_from_node(offset):
+                prefixes.append(shared(prefix, prefix))
+                finals.append(final_mask)
+                nextnodes.append(nextnode)
+            first_chars = "".join(p[0] for p in prefixes)
+            node = (
+                shared(first_chars, first_chars),
+                tuple(prefixes),
+                tuple(finals),
+                tuple(nextnodes),
+            )
+            # Concurrent threads may parse the same node, but they
+            # arrive at the same result, so this needs no lock
+            self._nodes[offset] = node
+        return node
+
+    def _iter_from_node(self, offset: int) -> Iterator[Tuple[str, int, int]]:
+        """A generator for yielding prefixes, final position bit masks
+        and next node offsets of the edges of the node starting at the
+        given offset in the DAWG bytearray"""
         assert self._b is not None
-        PackedNavigation(nav, self._b, self._root_offset, self._encoding).go()
-
-
-class PackedNavigation:
-    """Manages the state for a navigation while it is in progress"""
-
-    # The structure used to decode an edge offset from bytes
-    _UINT32 = struct.Struct("<L")
-
-    # Dictionary of edge iteration caches, keyed by byte buffer
-    _iter_caches: Dict[int, Dict[int, Dict[str, int]]] = dict()
-
-    def __init__(
-        self,
-        nav: Union[FindNavigator, CompoundNavigator],
-        b: mmap.mmap,
-        root_offset: int,
-        encoding: Dict[int, str],
-    ) -> None:
-        # Store the associated navigator
-        self._nav = nav
-        # The DAWG bytearray
-        self._b = b
-        self._root_offset = root_offset
-        self._encoding = encoding
-        self._iter_cache: Dict[int, Dict[str, int]]
-        if id(b) in self._iter_caches:
-            # We already have a cache associated with this byte buffer
-            self._iter_cache = self._iter_caches[id(b)]
-        else:
-            # Create a fresh cache for this byte buffer
-            self._iter_cache = self._iter_caches[id(b)] = cast(Dict[int, Dict[str, int]], dict())
-
-    def _iter_from_node(self, offset: int) -> Iterator[Tuple[str, int]]:
-        """A generator for yielding prefixes and next node offset along an edge
-        starting at the given offset in the DAWG bytearray"""
         b = self._b
         encoding = self._encoding
+        unpack_uint32 = self._UINT32.unpack_from
         num_edges = b[offset] & 0x7F
         offset += 1
         for _ in range(num_edges):
             len_byte = b[offset] & 0x7F
             offset += 1
-            prefix = "".join(encoding[b[offset + j]] for j in range(len_byte))
+            raw = b[offset : offset + len_byte]
+            prefix = raw.decode("latin-1").translate(encoding)
+            # Set bit j in the mask if the high bit of character j is set,
+            # denoting that the prefix up to and including it completes a word
+            final_mask = 0
+            if max(raw) & 0x80:
+                for j, c in enumerate(raw):
+                    if c & 0x80:
+                        final_mask |= 1 << j
             offset += len_byte
             if b[offset - 1] & 0x80:
                 # The last character of the prefix had a final marker: nextnode is 0
                 nextnode = 0
             else:
                 # Read the next node offset
-                (nextnode,) = self._UINT32.unpack_from(b, offset)  # Tuple of length 1, i.e. (n, )
+                (nextnode,) = unpack_uint32(b, offset)  # Tuple of length 1, i.e. (n, )
                 offset += 4
-            yield prefix, nextnode
-
-    def _make_iter_from_node(self, offset: int) -> ItemsView[str, int]:
-        """Return an iterator over the prefixes and next node pointers
-        of the edge at the given offset. If this is the first time
-        that the edge is iterated, cache its unpacked contents
-        in a dictionary for quicker subsequent iteration."""
-        d: Dict[str, int]
-        try:
-            d = self._iter_cache[offset]
-        except KeyError:
-            d = {prefix: nextnode for prefix, nextnode in self._iter_from_node(offset)}
-            self._iter_cache[offset] = d
-        return d.items()
+                if b[nextnode] & 0x80:
+                    # The next node is final (its header byte has the high bit
+                    # set), so the prefix completes a word at its last character
+                    final_mask |= 1 << (len_byte - 1)
+            yield prefix, final_mask, nextnode
+
+
+class PackedNavigation:
+    """Manages the state for a navigation while it is in progress"""
+
+    def __init__(
+        self,
+        nav: Navigator,
+        node: Callable[[int], DawgNode],
+        root_offset: int,
+    ) -> None:
+        # Store the associated navigator
+        self._nav = nav
+        # Function returning the parsed edges of the node at an offset
+        self._node = node
+        self._root_offset = root_offset
+        # Navigators that only ever enter the single edge whose first
+        # character is the next one in their word can say so explicitly:
+        # for those, we look up that edge directly instead of offering
+        # every edge
+        self._single_edge = getattr(nav, "single_edge", False) is True
+
+    def _navigate_word(self) -> None:
+        """Navigate from the root along the word of a single-edge navigator.
+        Since there is at most one edge to follow out of each node, this is
+        a simple loop. The matched string does not need to be built up one
+        character at a time, either, as the navigator can slice it from its
+        word. Single-edge navigators ignore non-final matches, so accept()
+        is only called for final ones."""
+        nav = cast(SingleEdgeNavigator, self._nav)
+        offset = self._root_offset
+        while nav.accepting():
+            first_chars, prefixes, finals, nextnodes = self._node(offset)
+            i = first_chars.find(nav.next_char())
+            if i < 0:
+                # No edge for the next character
+                return
+            final_mask = finals[i]
+            for c in prefixes[i]:
+                if not nav.accepting() or not nav.accepts(c):
+                    # The word ends or diverges within this edge
+                    return
+                if final_mask & 1:
+                    nav.accept(nav.matched(), True)
+                final_mask >>= 1
+            offset = nextnodes[i]
+            if offset == 0:
+                return
 
     def _navigate_from_node(self, offset: int, matched: str) -> None:
         """Starting from a given node, navigate outgoing edges"""
         # Go through the edges of this node and follow the ones
         # okayed by the navigator
         nav = self._nav
-        for prefix, nextnode in self._make_iter_from_node(offset):
+        _, prefixes, finals, nextnodes = self._node(offset)
+        for prefix, final_mask, nextnode in zip(prefixes, finals, nextnodes):
             if nav.push_edge(prefix[0]):
                 # This edge is a candidate: navigate through it
-                self._navigate_from_edge(prefix, nextnode, matched)
+                self._navigate_from_edge(prefix, final_mask, nextnode, matched)
                 if not nav.pop_edge():
                     # Short-circuit and finish the loop if pop_edge() returns False
                     break
 
-    def _navigate_from_edge(self, prefix: str, nextnode: int, matched: str) -> None:
+    def _navigate_from_edge(
+        self, prefix: str, final_mask: int, nextnode: int, matched: str
+    ) -> None:
         """Navigate along an edge, accepting partial and full matches"""
         # Go along the edge as long as the navigator is accepting
-        b = self._b
         lenp = len(prefix)
         j = 0
         nav = self._nav
@@ -394,21 +691,10 @@ class PackedNavigation:
                 return
             # So far, we have a match: add a letter to the matched path
             matched += prefix[j]
+            # Tell the navigator where we are, and whether the
+            # matched string is a complete word
+            nav.accept(matched, bool(final_mask >> j & 1))
             j += 1
-            # Check whether the next prefix character is a vertical bar,
-            # denoting finality
-            final = False
-            if j < lenp:
-                if prefix[j] == "|":
-                    final = True
-                    j += 1
-            elif nextnode == 0 or b[nextnode] & 0x80:
-                # If we're at the final char of the prefix and the next node is final,
-                # set the final flag as well (there is no trailing
-                # vertical bar in this case)
-                final = True
-            # Tell the navigator where we are
-            nav.accept(matched, final)
         # We're done following the prefix for as long as it goes and
         # as long as the navigator was accepting
         if j < lenp:
@@ -423,6 +709,8 @@ class PackedNavigation:
     def go(self) -> None:
         """Perform the navigation using the given navigator"""
         # The ship is ready to go
-        if self._nav.accepting():
+        if self._single_edge:
+            self._navigate_word()
+        elif self._nav.accepting():
             # Leave shore and navigate the open seas
             self._navigate_from_node(self._root_offset, "")
@@ -48,10 +48,9 @@ from typing import (
     Callable,
 )
 
+import sys
 import threading
 
-from collections import defaultdict
-
 from .basics import (
     ConfigError,
     LineReader,
@@ -63,6 +62,9 @@ from .basics import (
 StaticPhraseTuple = Tuple[str, str, str]
 # Type for preference specifications
 PreferenceTuple = Tuple[List[str], List[str], int]
+# Type for config section handlers, which take either a token list
+# or a pair of 'worse' and 'better' token lists
+SectionHandler = Callable[..., None]
 
 
 class AdjectiveTemplate:
@@ -71,20 +73,40 @@ class AdjectiveTemplate:
 
     # List of tuples: (ending, form_spec)
     ENDINGS: List[Tuple[str, str]] = []
+    # Dictionary of indices into ENDINGS, keyed by ending
+    INDEX: Dict[str, List[int]] = dict()
+    # Set of distinct ending lengths
+    LENGTHS: Set[int] = set()
 
     @classmethod
     def add(cls, ending: str, form: str) -> None:
         """Add an adjective ending and its associated form."""
+        cls.INDEX.setdefault(ending, []).append(len(cls.ENDINGS))
+        cls.LENGTHS.add(len(ending))
         cls.ENDINGS.append((ending, form))
 
+    @classmethod
+    def matches(cls, word: str) -> List[Tuple[str, str]]:
+        """Return the (ending, form_spec) tuples whose ending is a proper
+        suffix of the given word, in the order they were added"""
+        lw = len(word)
+        indices: List[int] = []
+        for n in cls.LENGTHS:
+            if lw > n:
+                ix = cls.INDEX.get(word[lw - n :])
+                if ix is not None:
+                    indices.extend(ix)
+        return [cls.ENDINGS[i] for i in sorted(indices)]
+
 
 class StemPreferences:
 
     """Wrapper around lemma disambiguation hints, initialized from the config file"""
 
     # Dictionary keyed by word form containing a tuple (worse, better)
-    # where each is a list word lemmas
-    DICT: Dict[str, Tuple[List[str], List[str]]] = dict()
+    # where each is a tuple of word lemmas. The preferences are only read
+    # after the config file has been loaded, so they are stored immutably.
+    DICT: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = dict()
 
     @staticmethod
     def add(word: str, worse: List[str], better: List[str]) -> None:
@@ -93,10 +115,12 @@ class StemPreferences:
             raise ConfigError(
                 "Duplicate lemma preference for word form {0}".format(word)
             )
-        StemPreferences.DICT[word] = (worse, better)
+        # Intern the key so that lookups of identical word forms
+        # can short-circuit on object identity
+        StemPreferences.DICT[sys.intern(word)] = (tuple(worse), tuple(better))
 
     @staticmethod
-    def get(word: str) -> Optional[Tuple[List[str], List[str]]]:
+    def get(word: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
         """Return a (worse, better) tuple for the given word form"""
         return StemPreferences.DICT.get(word, None)
 
@@ -108,14 +132,21 @@ class NounPreferences:
 
     # This is a dict of noun word forms, giving the relative priorities
     # of different genders
-    DICT: Dict[str, Dict[str, int]] = defaultdict(dict)
+    DICT: Dict[str, Dict[str, int]] = dict()
 
     @staticmethod
     def add(word: str, worse: str, better: str) -> None:
         """Add a preference to the dictionary. Called from the config file handler."""
         if worse not in ALL_GENDERS or better not in ALL_GENDERS:
             raise ConfigError("Noun priorities must specify genders (kk, kvk, hk)")
-        d = NounPreferences.DICT[word]
+        if worse == better:
+            # This would assign two different scores to the same gender
+            raise ConfigError("Noun priorities must specify two different genders")
+        # Intern the keys, since the same word forms and the three
+        # gender names recur throughout the config file
+        worse = sys.intern(worse)
+        better = sys.intern(better)
+        d = NounPreferences.DICT.setdefault(sys.intern(word), dict())
         worse_score = d.get(worse)
         better_score = d.get(better)
         if worse_score is not None:
@@ -167,18 +198,23 @@ class Settings:
     # Configuration settings from the GreynirPackage.conf file
 
     @staticmethod
-    def _handle_stem_preferences(s: str) -> None:
+    def _split_preference(s: str) -> Tuple[List[str], List[str]]:
+        """Split a preference line at its less-than sign, returning
+        the lowercased 'worse' and 'better' tokens"""
+        # A run of less-than signs ('<<') counts as a single one
+        worse, lt, better = s.lower().partition("<")
+        if not lt:
+            raise ConfigError("Preference missing less-than sign '<'")
+        return worse.split(), better.lstrip("<").split()
+
+    @staticmethod
+    def _handle_stem_preferences(w: List[str], b: List[str]) -> None:
         """Handle lemma ambiguity preference hints in the settings section"""
         # Format: word worse1 worse2... < better
-        a = s.lower().split("<", maxsplit=1)
-        if len(a) != 2:
-            raise ConfigError("Ambiguity preference missing less-than sign '<'")
-        w = a[0].split()
         if len(w) < 2:
             raise ConfigError(
                 "Ambiguity preference must have at least one 'worse' category"
             )
-        b = a[1].split()
         if len(b) < 1:
             raise ConfigError(
                 "Ambiguity preference must have at least one 'better' category"
@@ -186,25 +222,19 @@ class Settings:
         StemPreferences.add(w[0], w[1:], b)
 
     @staticmethod
-    def _handle_noun_preferences(s: str) -> None:
+    def _handle_noun_preferences(w: List[str], b: List[str]) -> None:
         """Handle noun preference hints in the settings section"""
         # Format: noun worse1 worse2... < better
         # The worse and better specifiers are gender names (kk, kvk, hk)
-        a = s.lower().split("<", maxsplit=1)
-        if len(a) != 2:
-            raise ConfigError("Noun preference missing less-than sign '<'")
-        w = a[0].split()
         if len(w) != 2:
             raise ConfigError("Noun preference must have exactly one 'worse' gender")
-        b = a[1].split()
         if len(b) != 1:
             raise ConfigError("Noun preference must have exactly one 'better' gender")
         NounPreferences.add(w[0], w[1], b[0])
 
     @staticmethod
-    def _handle_bin_errata(s: str) -> None:
+    def _handle_bin_errata(a: List[str]) -> None:
         """Handle changes to BÍN categories ('fl')"""
-        a = s.split()
         if len(a) != 3:
             raise ConfigError("Expected 'lemma ofl fl' fields in bin_errata section")
         lemma, ofl, fl = a
@@ -215,9 +245,8 @@ class Settings:
         BinErrata.add(lemma, ofl, fl)
 
     @staticmethod
-    def _handle_bin_deletions(s: str) -> None:
+    def _handle_bin_deletions(a: List[str]) -> None:
         """Handle deletions from BÍN, given as lemma/ofl/fl triples"""
-        a = s.split()
         if len(a) != 3:
             raise ConfigError("Expected 'lemma ofl fl' fields in bin_deletions section")
         lemma, ofl, fl = a
@@ -228,10 +257,9 @@ class Settings:
         BinDeletions.add(lemma, ofl, fl)
 
     @staticmethod
-    def _handle_adjective_template(s: str) -> None:
+    def _handle_adjective_template(a: List[str]) -> None:
         """Handle the template for new adjectives in the settings section"""
         # Format: adjective-ending bin-meaning
-        a = s.split()
         if len(a) != 2:
             raise ConfigError(
                 "Adjective template should have an ending and a form specifier"
@@ -242,45 +270,50 @@ class Settings:
     def read(fname: str, force: bool = False) -> None:
         """Read configuration file"""
 
+        if Settings.loaded and not force:
+            # Already loaded: no need to acquire the lock
+            return
+
         with Settings._lock:
 
+            # Check again, in case another thread loaded the
+            # configuration while we were waiting for the lock
             if Settings.loaded and not force:
                 return
 
-            CONFIG_HANDLERS: Dict[str, Callable[[str], None]] = {
-                "noun_preferences": Settings._handle_noun_preferences,
-                "stem_preferences": Settings._handle_stem_preferences,
-                "adjective_template": Settings._handle_adjective_template,
-                "undeclinable_adjectives": lambda _: None,  # Not required
-                "bin_errata": Settings._handle_bin_errata,
-                "bin_deletions": Settings._handle_bin_deletions,
-            }
-            handler: Optional[Callable[[str], None]] = None  # Current section handler
+            # Current section name, its handler and preference flag
+            section: Optional[str] = None
+            handler: Optional[SectionHandler] = None
+            preference = False
 
             rdr: Optional[LineReader] = None
             try:
                 rdr = LineReader(fname, package_name=__name__)
                 for s in rdr.lines():
                     # Ignore comments
-                    ix = s.find("#")
-                    if ix >= 0:
-                        s = s[0:ix]
-                    s = s.strip()
+                    s = s.partition("#")[0].strip()
                     if not s:
                         # Blank line: ignore
                         continue
                     if s[0] == "[" and s[-1] == "]":
                         # New section
                         section = s[1:-1].strip().lower()
-                        if section in CONFIG_HANDLERS:
-                            handler = CONFIG_HANDLERS[section]
+                        if section in _CONFIG_HANDLERS:
+                            handler, preference = _CONFIG_HANDLERS[section]
                             continue
                         raise ConfigError("Unknown section name '{0}'".format(section))
-                    if handler is None:
+                    if section is None:
                         raise ConfigError("No handler for config line '{0}'".format(s))
-                    # Call the correct handler depending on the section
+                    if handler is None:
+                        # Skipped section
+                        continue
+                    # Call the correct handler depending on the section,
+                    # splitting the line into tokens once
                     try:
-                        handler(s)
+                        if preference:
+                            handler(*Settings._split_preference(s))
+                        else:
+                            handler(s.split())
                     except ConfigError as e:
                         # Add file name and line number information to the exception
                         # if it's not already there
@@ -295,3 +328,18 @@ class Settings:
                 raise e
 
             Settings.loaded = True
+
+
+# Configuration section handlers, keyed by section name, with a flag for
+# preference sections. A handler is called with the whitespace-separated
+# tokens of each line, or, if the flag is set, with the lowercased tokens
+# on either side of the line's less-than sign. The contents of sections
+# without a handler are skipped.
+_CONFIG_HANDLERS: Dict[str, Tuple[Optional[SectionHandler], bool]] = {
+    "noun_preferences": (Settings._handle_noun_preferences, True),
+    "stem_preferences": (Settings._handle_stem_preferences, True),
+    "adjective_template": (Settings._handle_adjective_template, False),
+    "undeclinable_adjectives": (None, False),  # Not required
+    "bin_errata": (Settings._handle_bin_errata, False),
+    "bin_deletions": (Settings._handle_bin_deletions, False),
+}
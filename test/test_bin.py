@@ -30,20 +30,52 @@
 
 """
 
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Sequence, Set, Tuple, Union
+
+import pytest
 
 from islenska import Bin, BinEntry, BinFilterFunc
 from islenska.bincompress import BinCompressed
 from islenska.bindb import GreynirBin
+from islenska.dawgdictionary import FindNavigator, Wordbase
 
 
 BeygingFunc = Callable[[str], bool]
 
 
-def test_lookup() -> None:
+# The dictionary objects are expensive to create, so each
+# variant is created once and shared by all tests in the session
+
+
+@pytest.fixture(scope="session")
+def bin_compressed() -> BinCompressed:
+    return BinCompressed()
+
+
+@pytest.fixture(scope="session")
+def bin_db() -> Bin:
+    return Bin()
+
+
+@pytest.fixture(scope="session")
+def greynir_db() -> GreynirBin:
+    return GreynirBin()
+
+
+@pytest.fixture(scope="session")
+def bin_no_compounds() -> Bin:
+    return Bin(add_compounds=False)
+
+
+@pytest.fixture(scope="session")
+def bin_no_legur() -> Bin:
+    return Bin(add_legur=False)
+
+
+def test_lookup(bin_compressed: BinCompressed) -> None:
     """Test querying for different cases of words"""
 
-    b = BinCompressed()
+    b = bin_compressed
 
     assert b.lookup("") == []
     assert b.lookup("872364") == []
@@ -105,200 +137,262 @@ def test_lookup() -> None:
     assert k[0].ord == "sko"
 
 
-def test_bin() -> None:
-    """Test querying for different cases of words"""
-
-    b = BinCompressed()
-
-    def f(
-        word: str,
-        case: str,
-        lemma: str,
-        cat: str,
-        inflection_filter: Optional[BeygingFunc] = None,
-    ):
-        entries = b.lookup_case(
-            word, case, cat=cat, lemma=lemma, inflection_filter=inflection_filter
-        )
-        return {(m[4], m[5]) for m in entries}
-
-    def declension(
-        word: str, lemma: str, cat: str, inflection_filter: Optional[BeygingFunc] = None
-    ):
-        result: List[str] = []
-
-        def bf(b: str):
-            if inflection_filter is not None and not inflection_filter(b):
-                return False
-            return "2" not in b and "3" not in b
-
-        for case in ("NF", "ÞF", "ÞGF", "EF"):
-            wf_list = list(f(word, case, lemma, cat, bf))
-            result.append(wf_list[0][0] if wf_list else "N/A")
-        return tuple(result)
-
-    lo_filter: BeygingFunc = lambda b: "EVB" in b and "FT" in b
-
-    assert f("fjarðarins", "NF", "fjörður", "kk") == {("fjörðurinn", "NFETgr")}
-    assert f("breiðustu", "NF", "breiður", "lo", lo_filter) == {
-        ("breiðustu", "EVB-KVK-NFFT"),
-        ("breiðustu", "EVB-HK-NFFT"),
-        ("breiðustu", "EVB-KK-NFFT"),
-    }
-    assert b.lookup_case("fjarðarins", "NF", cat="kk", lemma="fjörður") == {
-        ("fjörður", 5697, "kk", "alm", "fjörðurinn", "NFETgr")
-    }
-    assert b.lookup_case("breiðastra", "NF", cat="lo", lemma="breiður") == {
-        ("breiður", 388135, "lo", "alm", "breiðastir", "ESB-KK-NFFT"),
-        ("breiður", 388135, "lo", "alm", "breiðastar", "ESB-KVK-NFFT"),
-        ("breiður", 388135, "lo", "alm", "breiðust", "ESB-HK-NFFT"),
-    }
-    assert f("fjarðarins", "ÞF", "fjörður", "kk") == {("fjörðinn", "ÞFETgr")}
-    assert f("breiðustu", "ÞF", "breiður", "lo", lo_filter) == {
-        ("breiðustu", "EVB-KVK-ÞFFT"),
-        ("breiðustu", "EVB-HK-ÞFFT"),
-        ("breiðustu", "EVB-KK-ÞFFT"),
-    }
-    assert f("fjarðarins", "ÞGF", "fjörður", "kk") == {("firðinum", "ÞGFETgr")}
-    assert f("breiðustu", "ÞGF", "breiður", "lo", lo_filter) == {
-        ("breiðustu", "EVB-KVK-ÞGFFT"),
-        ("breiðustu", "EVB-HK-ÞGFFT"),
-        ("breiðustu", "EVB-KK-ÞGFFT"),
-    }
-    assert f("fjarðarins", "EF", "fjörður", "kk") == {("fjarðarins", "EFETgr")}
-    assert f("breiðustu", "EF", "breiður", "lo", lo_filter) == {
-        ("breiðustu", "EVB-KVK-EFFT"),
-        ("breiðustu", "EVB-HK-EFFT"),
-        ("breiðustu", "EVB-KK-EFFT"),
-    }
-    assert declension("brjóstsykur", "brjóstsykur", "kk") == (
+def case_forms(
+    b: BinCompressed,
+    word: str,
+    case: str,
+    lemma: str,
+    cat: str,
+    inflection_filter: Optional[BeygingFunc] = None,
+) -> Set[Tuple[str, str]]:
+    """Return the (word form, inflection) pairs of a word in the given case"""
+    entries = b.lookup_case(
+        word, case, cat=cat, lemma=lemma, inflection_filter=inflection_filter
+    )
+    return {(m[4], m[5]) for m in entries}
+
+
+def no_alternates(b: str) -> bool:
+    """Return True if the inflection is not an alternate ('2' or '3') form"""
+    return "2" not in b and "3" not in b
+
+
+def declension(
+    b: BinCompressed,
+    word: str,
+    lemma: str,
+    cat: str,
+    inflection_filter: Optional[BeygingFunc] = None,
+) -> Tuple[str, ...]:
+    """Return the NF, ÞF, ÞGF and EF forms of a word"""
+    result: List[str] = []
+
+    bf: BeygingFunc = no_alternates
+    if inflection_filter is not None:
+        f = inflection_filter
+        bf = lambda b: f(b) and no_alternates(b)
+
+    for case in ("NF", "ÞF", "ÞGF", "EF"):
+        wf_list = list(case_forms(b, word, case, lemma, cat, bf))
+        result.append(wf_list[0][0] if wf_list else "N/A")
+    return tuple(result)
+
+
+_lo_filter: BeygingFunc = lambda b: "EVB" in b and "FT" in b
+
+# Test cases for forms of a word in a given case:
+# (word, case, lemma, cat, inflection_filter, expected)
+CASE_FORMS_CASES = [
+    ("fjarðarins", "NF", "fjörður", "kk", None, {("fjörðurinn", "NFETgr")}),
+    (
+        "breiðustu",
+        "NF",
+        "breiður",
+        "lo",
+        _lo_filter,
+        {
+            ("breiðustu", "EVB-KVK-NFFT"),
+            ("breiðustu", "EVB-HK-NFFT"),
+            ("breiðustu", "EVB-KK-NFFT"),
+        },
+    ),
+    ("fjarðarins", "ÞF", "fjörður", "kk", None, {("fjörðinn", "ÞFETgr")}),
+    (
+        "breiðustu",
+        "ÞF",
+        "breiður",
+        "lo",
+        _lo_filter,
+        {
+            ("breiðustu", "EVB-KVK-ÞFFT"),
+            ("breiðustu", "EVB-HK-ÞFFT"),
+            ("breiðustu", "EVB-KK-ÞFFT"),
+        },
+    ),
+    ("fjarðarins", "ÞGF", "fjörður", "kk", None, {("firðinum", "ÞGFETgr")}),
+    (
+        "breiðustu",
+        "ÞGF",
+        "breiður",
+        "lo",
+        _lo_filter,
+        {
+            ("breiðustu", "EVB-KVK-ÞGFFT"),
+            ("breiðustu", "EVB-HK-ÞGFFT"),
+            ("breiðustu", "EVB-KK-ÞGFFT"),
+        },
+    ),
+    ("fjarðarins", "EF", "fjörður", "kk", None, {("fjarðarins", "EFETgr")}),
+    (
+        "breiðustu",
+        "EF",
+        "breiður",
+        "lo",
+        _lo_filter,
+        {
+            ("breiðustu", "EVB-KVK-EFFT"),
+            ("breiðustu", "EVB-HK-EFFT"),
+            ("breiðustu", "EVB-KK-EFFT"),
+        },
+    ),
+]
+
+# Test cases for declensions of nouns:
+# (word, lemma, cat, inflection_filter, expected NF, ÞF, ÞGF, EF)
+DECLENSION_CASES = [
+    (
         "brjóstsykur",
         "brjóstsykur",
-        "brjóstsykri",
-        "brjóstsykurs",
-    )
-    assert declension("smáskífa", "smáskífa", "kvk", lambda b: "ET" in b) == (
+        "kk",
+        None,
+        ("brjóstsykur", "brjóstsykur", "brjóstsykri", "brjóstsykurs"),
+    ),
+    (
         "smáskífa",
-        "smáskífu",
-        "smáskífu",
-        "smáskífu",
-    )
-    assert declension("smáskífa", "smáskífa", "kvk", lambda b: "FT" in b) == (
-        "smáskífur",
-        "smáskífur",
-        "smáskífum",
         "smáskífa",
-    )
-    assert declension("ungabarn", "ungabarn", "hk") == (
+        "kvk",
+        lambda b: "ET" in b,
+        ("smáskífa", "smáskífu", "smáskífu", "smáskífu"),
+    ),
+    (
+        "smáskífa",
+        "smáskífa",
+        "kvk",
+        lambda b: "FT" in b,
+        ("smáskífur", "smáskífur", "smáskífum", "smáskífa"),
+    ),
+    (
         "ungabarn",
         "ungabarn",
-        "ungabarni",
-        "ungabarns",
-    )
-    assert declension("geymir", "geymir", "kk") == (
-        "geymir",
-        "geymi",
-        "geymi",
-        "geymis",
-    )
-    assert declension("sulta", "sulta", "kvk", lambda b: "ET" in b) == (
+        "hk",
+        None,
+        ("ungabarn", "ungabarn", "ungabarni", "ungabarns"),
+    ),
+    ("geymir", "geymir", "kk", None, ("geymir", "geymi", "geymi", "geymis")),
+    (
         "sulta",
-        "sultu",
-        "sultu",
-        "sultu",
-    )
-    assert declension("vígi", "vígi", "hk", lambda b: "ET" in b) == (
-        "vígi",
-        "vígi",
-        "vígi",
-        "vígis",
-    )
-    assert declension("buxur", "buxur", "kvk") == ("buxur", "buxur", "buxum", "buxna")
-    assert declension("ríki", "ríki", "hk", lambda b: "ET" in b) == (
-        "ríki",
-        "ríki",
-        "ríki",
-        "ríkis",
-    )
-    assert declension("ríki", "ríki", "hk", lambda b: "FT" in b) == (
-        "ríki",
-        "ríki",
-        "ríkjum",
-        "ríkja",
-    )
-    assert declension("ríki", "ríkir", "kk") == ("ríkir", "ríki", "ríki", "ríkis")
-    assert declension("brjóstsykurinn", "brjóstsykur", "kk") == (
-        "brjóstsykurinn",
+        "sulta",
+        "kvk",
+        lambda b: "ET" in b,
+        ("sulta", "sultu", "sultu", "sultu"),
+    ),
+    ("vígi", "vígi", "hk", lambda b: "ET" in b, ("vígi", "vígi", "vígi", "vígis")),
+    ("buxur", "buxur", "kvk", None, ("buxur", "buxur", "buxum", "buxna")),
+    ("ríki", "ríki", "hk", lambda b: "ET" in b, ("ríki", "ríki", "ríki", "ríkis")),
+    ("ríki", "ríki", "hk", lambda b: "FT" in b, ("ríki", "ríki", "ríkjum", "ríkja")),
+    ("ríki", "ríkir", "kk", None, ("ríkir", "ríki", "ríki", "ríkis")),
+    (
         "brjóstsykurinn",
-        "brjóstsykrinum",
-        "brjóstsykursins",
-    )
-    assert declension("smáskífan", "smáskífa", "kvk") == (
+        "brjóstsykur",
+        "kk",
+        None,
+        ("brjóstsykurinn", "brjóstsykurinn", "brjóstsykrinum", "brjóstsykursins"),
+    ),
+    (
         "smáskífan",
-        "smáskífuna",
-        "smáskífunni",
-        "smáskífunnar",
-    )
-    assert declension("ungabarnið", "ungabarn", "hk") == (
-        "ungabarnið",
+        "smáskífa",
+        "kvk",
+        None,
+        ("smáskífan", "smáskífuna", "smáskífunni", "smáskífunnar"),
+    ),
+    (
         "ungabarnið",
-        "ungabarninu",
-        "ungabarnsins",
-    )
-    assert declension("geymirinn", "geymir", "kk") == (
+        "ungabarn",
+        "hk",
+        None,
+        ("ungabarnið", "ungabarnið", "ungabarninu", "ungabarnsins"),
+    ),
+    (
         "geymirinn",
-        "geyminn",
-        "geyminum",
-        "geymisins",
-    )
-    assert declension("sultan", "sulta", "kvk") == (
-        "sultan",
-        "sultuna",
-        "sultunni",
-        "sultunnar",
-    )
-    assert declension("vígið", "vígi", "hk") == ("vígið", "vígið", "víginu", "vígisins")
-    assert declension("ríkið", "ríki", "hk") == ("ríkið", "ríkið", "ríkinu", "ríkisins")
-    assert declension("geymarnir", "geymir", "kk") == (
+        "geymir",
+        "kk",
+        None,
+        ("geymirinn", "geyminn", "geyminum", "geymisins"),
+    ),
+    ("sultan", "sulta", "kvk", None, ("sultan", "sultuna", "sultunni", "sultunnar")),
+    ("vígið", "vígi", "hk", None, ("vígið", "vígið", "víginu", "vígisins")),
+    ("ríkið", "ríki", "hk", None, ("ríkið", "ríkið", "ríkinu", "ríkisins")),
+    (
         "geymarnir",
-        "geymana",
-        "geymunum",
-        "geymanna",
-    )
-    assert declension("sulturnar", "sulta", "kvk") == (
-        "sulturnar",
+        "geymir",
+        "kk",
+        None,
+        ("geymarnir", "geymana", "geymunum", "geymanna"),
+    ),
+    (
         "sulturnar",
-        "sultunum",
-        "sultnanna",
-    )
-    assert declension("vígin", "vígi", "hk") == (
-        "vígin",
-        "vígin",
-        "vígjunum",
-        "vígjanna",
-    )
-    assert declension("buxurnar", "buxur", "kvk") == (
-        "buxurnar",
-        "buxurnar",
-        "buxunum",
-        "buxnanna",
-    )
-    assert declension("ríkin", "ríki", "hk") == (
-        "ríkin",
-        "ríkin",
-        "ríkjunum",
-        "ríkjanna",
-    )
-    assert declension("Vestur-Þýskalands", "Vestur-Þýskaland", "hk") == (
-        "Vestur-Þýskaland",
-        "Vestur-Þýskaland",
-        "Vestur-Þýskalandi",
+        "sulta",
+        "kvk",
+        None,
+        ("sulturnar", "sulturnar", "sultunum", "sultnanna"),
+    ),
+    ("vígin", "vígi", "hk", None, ("vígin", "vígin", "vígjunum", "vígjanna")),
+    ("buxurnar", "buxur", "kvk", None, ("buxurnar", "buxurnar", "buxunum", "buxnanna")),
+    ("ríkin", "ríki", "hk", None, ("ríkin", "ríkin", "ríkjunum", "ríkjanna")),
+    (
         "Vestur-Þýskalands",
+        "Vestur-Þýskaland",
+        "hk",
+        None,
+        (
+            "Vestur-Þýskaland",
+            "Vestur-Þýskaland",
+            "Vestur-Þýskalandi",
+            "Vestur-Þýskalands",
+        ),
+    ),
+]
+
+
+def test_bin(bin_compressed: BinCompressed) -> None:
+    """Test querying for different cases of words"""
+
+    b = bin_compressed
+
+    assert b.lookup_case("fjarðarins", "NF", cat="kk", lemma="fjörður") == {
+        ("fjörður", 5697, "kk", "alm", "fjörðurinn", "NFETgr")
+    }
+    assert b.lookup_case("breiðastra", "NF", cat="lo", lemma="breiður") == {
+        ("breiður", 388135, "lo", "alm", "breiðastir", "ESB-KK-NFFT"),
+        ("breiður", 388135, "lo", "alm", "breiðastar", "ESB-KVK-NFFT"),
+        ("breiður", 388135, "lo", "alm", "breiðust", "ESB-HK-NFFT"),
+    }
+
+
+@pytest.mark.parametrize(
+    "word,case,lemma,cat,inflection_filter,expected", CASE_FORMS_CASES
+)
+def test_case_forms(
+    bin_compressed: BinCompressed,
+    word: str,
+    case: str,
+    lemma: str,
+    cat: str,
+    inflection_filter: Optional[BeygingFunc],
+    expected: Set[Tuple[str, str]],
+) -> None:
+    """Test the forms of words in a given case"""
+    assert (
+        case_forms(bin_compressed, word, case, lemma, cat, inflection_filter)
+        == expected
     )
 
 
-def test_bindb() -> None:
-    db = GreynirBin()
+@pytest.mark.parametrize("word,lemma,cat,inflection_filter,expected", DECLENSION_CASES)
+def test_declension(
+    bin_compressed: BinCompressed,
+    word: str,
+    lemma: str,
+    cat: str,
+    inflection_filter: Optional[BeygingFunc],
+    expected: Tuple[str, ...],
+) -> None:
+    """Test the declension of nouns in all four cases"""
+    assert declension(bin_compressed, word, lemma, cat, inflection_filter) == expected
+
+
+def test_bindb(greynir_db: GreynirBin) -> None:
+    db = greynir_db
     # Test the lemma lookup functionality
     w, m = db.lookup_lemmas("eignast")
     assert w == "eignast"
@@ -357,8 +451,8 @@ def test_bindb() -> None:
     assert any(mm.ofl == "hk" for mm in m)
 
 
-def test_compounds() -> None:
-    db = Bin()
+def test_compounds(bin_db: Bin) -> None:
+    db = bin_db
     _, m = db.lookup("fjármála- og efnahagsráðherra")
     assert m
     assert m[0].ord == "fjármála- og efnahags-ráðherra"
@@ -416,8 +510,86 @@ def test_compounds() -> None:
     assert set(lc) == {("fjármála- og efnahags-ráðherra", "kk")}
 
 
-def test_key() -> None:
-    db = Bin()
+class _PrefixRecorder(FindNavigator):
+    """A FindNavigator that also records non-final matches, and thus
+    has to opt out of single-edge navigation"""
+
+    single_edge = False
+
+    def __init__(self, word: str) -> None:
+        super().__init__(word)
+        self.seen: List[Tuple[str, bool]] = []
+
+    def accept(self, matched: str, final: bool) -> None:
+        self.seen.append((matched, final))
+        super().accept(matched, final)
+
+
+class _CompletionNavigator:
+    """Collects the words in the DAWG that start with a given prefix,
+    up to a maximum length, by entering every matching edge of a node"""
+
+    def __init__(self, prefix: str, max_len: int) -> None:
+        self._prefix = prefix
+        self._max_len = max_len
+        self._index = 0
+        self._stack: List[int] = []
+        self.words: List[str] = []
+
+    def _fits(self, ch: str) -> bool:
+        return self._index >= len(self._prefix) or ch == self._prefix[self._index]
+
+    def push_edge(self, firstchar: str) -> bool:
+        if not self._fits(firstchar):
+            return False
+        self._stack.append(self._index)
+        return True
+
+    def accepting(self) -> bool:
+        return self._index < self._max_len
+
+    def accepts(self, newchar: str) -> bool:
+        if not self._fits(newchar):
+            return False
+        self._index += 1
+        return True
+
+    def accept(self, matched: str, final: bool) -> None:
+        if final and self._index >= len(self._prefix):
+            self.words.append(matched)
+
+    def pop_edge(self) -> bool:
+        # Restore the state from before the edge was entered,
+        # and go on to the next edge
+        self._index = self._stack.pop()
+        return True
+
+
+def test_navigate() -> None:
+    dawg = Wordbase.dawg()
+    nav = FindNavigator("hestur")
+    dawg.navigate(nav)
+    assert nav.is_found()
+    rec = _PrefixRecorder("hestur")
+    dawg.navigate(rec)
+    assert rec.is_found()
+    # A navigator that does not opt into single-edge navigation
+    # is told about every character matched, final or not
+    assert [m for m, _ in rec.seen] == ["h", "he", "hes", "hest", "hestu", "hestur"]
+    assert ("hestur", True) in rec.seen
+    assert ("hestu", False) in rec.seen
+    # A navigator that explores multiple edges out of each node
+    comp = _CompletionNavigator("hest", 6)
+    dawg.navigate(comp)
+    assert {"hestur", "hestar", "hestum", "hesti", "hests"} <= set(comp.words)
+    assert len(comp.words) == len(set(comp.words))
+    assert all(
+        w.startswith("hest") and len(w) <= 6 and w in dawg for w in comp.words
+    )
+
+
+def test_key(bin_db: Bin) -> None:
+    db = bin_db
     w, m = db.lookup("Rússíbanamiðasala")
     assert w == "rússíbanamiðasala"
     assert all(mm.ord in ("rússíbana-miðasala", "rússíbana-miðasali") for mm in m)
@@ -435,9 +607,9 @@ def test_key() -> None:
     assert all(mm.ord == "Ytri-Hnaus" for mm in m)
 
 
-def test_compatibility() -> None:
-    db_bin = Bin()
-    db_greynir = GreynirBin()
+def test_compatibility(bin_db: Bin, greynir_db: GreynirBin) -> None:
+    db_bin = bin_db
+    db_greynir = greynir_db
     _, m = db_bin.lookup("sig")
     assert any(mm.ofl == "afn" for mm in m)
     _, m = db_greynir.lookup("sig")
@@ -506,7 +678,13 @@ def test_compatibility() -> None:
     assert len(m) == 0
     _, m = db_bin.lookup("kattarkjólsins")
     assert m and all(mm.ofl == "kk" for mm in m)
-    db_bin = Bin(add_compounds=False)
+
+
+def test_compatibility_no_compounds(
+    bin_no_compounds: Bin, greynir_db: GreynirBin
+) -> None:
+    db_bin = bin_no_compounds
+    db_greynir = greynir_db
     _, m = db_bin.lookup("merkikertisyrðunum")
     assert len(m) == 0
     _, m = db_bin.lookup("kattarkjólsins")
@@ -531,101 +709,74 @@ def test_compatibility() -> None:
     assert m and all("FT" in mm.mark for mm in m) and m[0].bmynd == "merkikertis-yrðin"
 
 
-def test_legur() -> None:
-    db = Bin()
-    _, m = db.lookup("forritunarvillulegur")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvilluleg")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegt")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegir")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegar")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegu")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    db = Bin(add_legur=False)
-    _, m = db.lookup("forritunarvillulegur")
-    assert all(mm.ofl != "lo" for mm in m)
-    _, m = db.lookup("forritunarvilluleg")
-    assert all(mm.ofl != "lo" for mm in m)
-    _, m = db.lookup("forritunarvillulegt")
-    assert all(mm.ofl != "lo" for mm in m)
-    _, m = db.lookup("forritunarvillulegir")
-    assert all(mm.ofl != "lo" for mm in m)
-    _, m = db.lookup("forritunarvillulegar")
-    assert all(mm.ofl != "lo" for mm in m)
-    _, m = db.lookup("forritunarvillulegu")
-    assert all(mm.ofl != "lo" for mm in m)
-    db = GreynirBin()
-    _, m = db.lookup("forritunarvillulegur")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvilluleg")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegt")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegir")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegar")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-    _, m = db.lookup("forritunarvillulegu")
-    assert any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
-
-
-def test_casting() -> None:
-    """Test functions to cast words in nominative case to other cases"""
-    db = Bin()
+# Word forms of an adjective ending in -legur that is not found in BÍN
+LEGUR_FORMS = (
+    "forritunarvillulegur",
+    "forritunarvilluleg",
+    "forritunarvillulegt",
+    "forritunarvillulegir",
+    "forritunarvillulegar",
+    "forritunarvillulegu",
+)
 
-    assert db.cast_to_accusative("") == ""
-    assert db.cast_to_dative("") == ""
-    assert db.cast_to_genitive("") == ""
 
-    assert db.cast_to_accusative("xxx") == "xxx"
-    assert db.cast_to_dative("xxx") == "xxx"
-    assert db.cast_to_genitive("xxx") == "xxx"
+def has_lo_legur(m: List[BinEntry]) -> bool:
+    """Return True if an adjective ending in -legur is among the entries"""
+    return any(mm.ofl == "lo" and mm.ord.endswith("legur") for mm in m)
 
-    assert db.cast_to_accusative("maðurinn") == "manninn"
-    assert db.cast_to_dative("maðurinn") == "manninum"
-    assert db.cast_to_genitive("maðurinn") == "mannsins"
 
-    assert db.cast_to_accusative("mennirnir") == "mennina"
-    assert db.cast_to_dative("mennirnir") == "mönnunum"
-    assert db.cast_to_genitive("mennirnir") == "mannanna"
+@pytest.mark.parametrize("word", LEGUR_FORMS)
+def test_legur(bin_db: Bin, word: str) -> None:
+    _, m = bin_db.lookup(word)
+    assert has_lo_legur(m)
 
-    assert db.cast_to_accusative("framkvæma") == "framkvæma"
-    assert db.cast_to_dative("framkvæma") == "framkvæma"
-    assert db.cast_to_genitive("framkvæma") == "framkvæma"
 
-    assert db.cast_to_accusative("stóru") == "stóru"
-    assert db.cast_to_dative("stóru") == "stóru"
-    assert db.cast_to_genitive("stóru") == "stóru"
+@pytest.mark.parametrize("word", LEGUR_FORMS)
+def test_no_legur(bin_no_legur: Bin, word: str) -> None:
+    _, m = bin_no_legur.lookup(word)
+    assert all(mm.ofl != "lo" for mm in m)
+
+
+@pytest.mark.parametrize("word", LEGUR_FORMS)
+def test_legur_greynir(greynir_db: GreynirBin, word: str) -> None:
+    _, m = greynir_db.lookup(word)
+    assert has_lo_legur(m)
 
-    assert db.cast_to_accusative("stóri") == "stóra"
-    assert db.cast_to_dative("stóri") == "stóra"
-    assert db.cast_to_genitive("stóri") == "stóra"
 
-    assert db.cast_to_accusative("kattarhestur") == "kattarhest"
-    assert db.cast_to_dative("kattarhestur") == "kattarhesti"
-    assert db.cast_to_genitive("kattarhestur") == "kattarhests"
+# Test cases for casting words in nominative case to other cases:
+# (word, accusative, dative, genitive)
+CAST_CASES = [
+    ("", "", "", ""),
+    ("xxx", "xxx", "xxx", "xxx"),
+    ("maðurinn", "manninn", "manninum", "mannsins"),
+    ("mennirnir", "mennina", "mönnunum", "mannanna"),
+    ("framkvæma", "framkvæma", "framkvæma", "framkvæma"),
+    ("stóru", "stóru", "stóru", "stóru"),
+    ("stóri", "stóra", "stóra", "stóra"),
+    ("kattarhestur", "kattarhest", "kattarhesti", "kattarhests"),
+    ("Kattarhestur", "Kattarhest", "Kattarhesti", "Kattarhests"),
+    ("Suður-Afríka", "Suður-Afríku", "Suður-Afríku", "Suður-Afríku"),
+    ("Vestur-Þýskaland", "Vestur-Þýskaland", "Vestur-Þýskalandi", "Vestur-Þýskalands"),
+]
 
-    assert db.cast_to_accusative("Kattarhestur") == "Kattarhest"
-    assert db.cast_to_dative("Kattarhestur") == "Kattarhesti"
-    assert db.cast_to_genitive("Kattarhestur") == "Kattarhests"
+
+@pytest.mark.parametrize("word,acc,dat,gen", CAST_CASES)
+def test_cast(bin_db: Bin, word: str, acc: str, dat: str, gen: str) -> None:
+    """Test functions to cast words in nominative case to other cases"""
+    assert bin_db.cast_to_accusative(word) == acc
+    assert bin_db.cast_to_dative(word) == dat
+    assert bin_db.cast_to_genitive(word) == gen
+
+
+def test_casting(bin_db: Bin) -> None:
+    """Test casting words to other cases with filter functions"""
+    db = bin_db
 
     f: BinFilterFunc = lambda mm: [m for m in mm if "2" not in m.mark]
     assert db.cast_to_accusative("fjórir", filter_func=f) == "fjóra"
     assert db.cast_to_dative("fjórir", filter_func=f) == "fjórum"
     assert db.cast_to_genitive("fjórir", filter_func=f) == "fjögurra"
 
-    assert db.cast_to_accusative("Suður-Afríka") == "Suður-Afríku"
-    assert db.cast_to_dative("Suður-Afríka") == "Suður-Afríku"
-    assert db.cast_to_genitive("Suður-Afríka") == "Suður-Afríku"
-
-    assert db.cast_to_accusative("Vestur-Þýskaland") == "Vestur-Þýskaland"
-    assert db.cast_to_dative("Vestur-Þýskaland") == "Vestur-Þýskalandi"
-    assert db.cast_to_genitive("Vestur-Þýskaland") == "Vestur-Þýskalands"
-
     f: BinFilterFunc = lambda mm: sorted(
         mm, key=lambda m: "2" in m.mark or "3" in m.mark
     )
@@ -639,8 +790,8 @@ def test_casting() -> None:
     )
 
 
-def test_forms():
-    db = Bin()
+def test_forms(bin_db: Bin):
+    db = bin_db
     l: List[BinEntry]
     l = db.lookup_forms("köttur", "kvk", "nf")
     assert len(l) == 0
@@ -656,34 +807,159 @@ def test_forms():
     assert len(l) == 0
     l = db.lookup_forms("kettirnir", "kk", "nf")
     assert len(l) == 0
-    l = db.lookup_forms("köttur", "kk", "nf")
-    om = set(m.bmynd for m in l)
-    assert "köttur" in om
-    assert "kettir" in om
-    assert "kötturinn" in om
-    assert "kettirnir" in om
-    l = db.lookup_forms("köttur", "kk", "þf")
-    om = set(m.bmynd for m in l)
-    assert "kött" in om
-    assert "ketti" in om
-    assert "köttinn" in om
-    assert "kettina" in om
-    l = db.lookup_forms("köttur", "kk", "þgf")
-    om = set(m.bmynd for m in l)
-    assert "ketti" in om
-    assert "köttum" in om
-    assert "kettinum" in om
-    assert "köttunum" in om
-    l = db.lookup_forms("köttur", "kk", "ef")
-    om = set(m.bmynd for m in l)
-    assert "kattar" in om
-    assert "kattarins" in om
-    assert "katta" in om
-    assert "kattanna" in om
-
-
-def test_variants() -> None:
-    b = Bin()
+
+
+# Test cases for the forms of a lemma in a given case:
+# (lemma, cat, case, expected word forms)
+FORMS_CASES = [
+    ("köttur", "kk", "nf", ("köttur", "kettir", "kötturinn", "kettirnir")),
+    ("köttur", "kk", "þf", ("kött", "ketti", "köttinn", "kettina")),
+    ("köttur", "kk", "þgf", ("ketti", "köttum", "kettinum", "köttunum")),
+    ("köttur", "kk", "ef", ("kattar", "kattarins", "katta", "kattanna")),
+]
+
+
+@pytest.mark.parametrize("lemma,cat,case,expected", FORMS_CASES)
+def test_forms_case(
+    bin_db: Bin, lemma: str, cat: str, case: str, expected: Tuple[str, ...]
+) -> None:
+    """Test the word forms of a lemma in a given case"""
+    l = bin_db.lookup_forms(lemma, cat, case)
+    assert set(expected) <= {m.bmynd for m in l}
+
+
+_not_op: BeygingFunc = lambda b: "OP" not in b
+
+# Test cases for grammatical variants of words:
+# (word, cat, variants, lemma, inflection_filter, first word form, expected marks)
+VARIANT_CASES = [
+    (
+        "borgarstjórnin",
+        "no",
+        ("EF", "FT"),
+        None,
+        None,
+        "borgarstjórnanna",
+        ("EF", "FT"),
+    ),
+    (
+        "borgarstjórnin",
+        "kvk",
+        ("EF", "FT"),
+        None,
+        None,
+        "borgarstjórnanna",
+        ("EF", "FT"),
+    ),
+    (
+        "borgarstjórn",
+        "no",
+        ("EF", "gr"),
+        None,
+        None,
+        "borgarstjórnarinnar",
+        ("EF", "gr"),
+    ),
+    (
+        "borgarstjórn",
+        "kvk",
+        ("EF", "gr"),
+        None,
+        None,
+        "borgarstjórnarinnar",
+        ("EF", "gr"),
+    ),
+    ("fór", "so", ("VH", "ÞT"), "fara", None, "færi", ("VH", "ÞT")),
+    ("fór", "so", ("VH", "NT"), "fara", None, "fari", ("VH", "NT")),
+    (
+        "fór",
+        "so",
+        ("VH", "FT", "NT", "1P"),
+        "fara",
+        _not_op,
+        "förum",
+        ("VH", "FT", "NT", "1P"),
+    ),
+    (
+        "fór",
+        "so",
+        ("VH", "FT", "ÞT", "1P"),
+        "fara",
+        _not_op,
+        "færum",
+        ("VH", "FT", "ÞT", "1P"),
+    ),
+    (
+        "fór",
+        "so",
+        ("vh", "ft", "þt", "p1"),
+        "fara",
+        _not_op,
+        "færum",
+        ("VH", "FT", "ÞT", "1P"),
+    ),
+    ("fór", "so", ("NT",), "fara", None, "fer", ("NT",)),
+    ("fór", "so", ("MM",), "fara", None, "fórst", ("MM",)),
+    ("fór", "so", ("MM", "NT"), "fara", None, "ferst", ("MM", "NT")),
+    (
+        "fór",
+        "so",
+        ("MM", "NT", "2P", "FT"),
+        "fara",
+        _not_op,
+        "farist",
+        ("MM", "NT", "2P", "FT"),
+    ),
+    (
+        "fór",
+        "so",
+        ("MM", "NT", "p2", "FT"),
+        "fara",
+        _not_op,
+        "farist",
+        ("MM", "NT", "2P", "FT"),
+    ),
+    ("skrifar", "so", ("ÞT", "1P"), None, None, "skrifaði", ("ÞT", "1P")),
+    ("skrifar", "so", ("ÞT", "2P"), None, None, "skrifaðir", ("ÞT", "2P")),
+    ("skrifuðu", "so", ("FH", "ET", "NT"), None, None, "skrifar", ("FH", "ET", "NT")),
+    ("fallegur", "lo", "MST", None, None, "fallegri", ("MST",)),
+    ("fallegur", "lo", ("MST", "HK"), None, None, "fallegra", ("MST", "HK")),
+    ("fallegur", "lo", ("MST", "KVK"), None, None, "fallegri", ("MST", "KVK")),
+    ("fallegur", "lo", "EVB", None, None, "fallegasti", ("EVB",)),
+    ("fallegur", "lo", "ESB", None, None, "fallegastur", ("ESB",)),
+    ("fallegur", "lo", ("EVB", "KVK"), None, None, "fallegasta", ("EVB", "KVK")),
+    ("fallegur", "lo", ("ESB", "KVK"), None, None, "fallegust", ("ESB", "KVK")),
+    ("fallegur", "lo", ("EVB", "HK"), None, None, "fallegasta", ("EVB", "HK")),
+    ("fallegur", "lo", ("ESB", "HK"), None, None, "fallegast", ("ESB", "HK")),
+]
+
+
+@pytest.mark.parametrize(
+    "word,cat,variants,lemma,inflection_filter,bmynd,marks", VARIANT_CASES
+)
+def test_variant(
+    bin_db: Bin,
+    word: str,
+    cat: str,
+    variants: Union[str, Sequence[str]],
+    lemma: Optional[str],
+    inflection_filter: Optional[BeygingFunc],
+    bmynd: str,
+    marks: Tuple[str, ...],
+) -> None:
+    """Test that the variants of a word have the expected marks,
+    with the closest match first"""
+    m = bin_db.lookup_variants(
+        word, cat, variants, lemma=lemma, inflection_filter=inflection_filter
+    )
+    assert m and m[0].bmynd == bmynd
+    assert all(all(x in mm.mark for x in marks) for mm in m)
+    if inflection_filter is not None:
+        assert all(inflection_filter(mm.mark) for mm in m)
+
+
+def test_variants(bin_db: Bin) -> None:
+    b = bin_db
 
     m = b.lookup_variants("borgarstjórnin", "no", "EF")
     assert (
@@ -709,24 +985,8 @@ def test_variants() -> None:
     )
     m = b.lookup_variants("borgarstjórnin", "hk", ("EF", "nogr"))
     assert not m
-    m = b.lookup_variants("borgarstjórnin", "no", ("EF", "FT"))
-    assert m[0].bmynd == "borgarstjórnanna" and all(
-        "EF" in mm.mark and "FT" in mm.mark for mm in m
-    )
-    m = b.lookup_variants("borgarstjórnin", "kvk", ("EF", "FT"))
-    assert m[0].bmynd == "borgarstjórnanna" and all(
-        "EF" in mm.mark and "FT" in mm.mark for mm in m
-    )
     m = b.lookup_variants("borgarstjórnin", "kk", ("EF", "FT"))
     assert not m
-    m = b.lookup_variants("borgarstjórn", "no", ("EF", "gr"))
-    assert m[0].bmynd == "borgarstjórnarinnar" and all(
-        "EF" in mm.mark and "gr" in mm.mark for mm in m
-    )
-    m = b.lookup_variants("borgarstjórn", "kvk", ("EF", "gr"))
-    assert m[0].bmynd == "borgarstjórnarinnar" and all(
-        "EF" in mm.mark and "gr" in mm.mark for mm in m
-    )
     m = b.lookup_variants("borgarstjórn", "kk", ("EF", "gr"))
     assert not m
     m = b.lookup_variants("borgarstjórn", "no", ("EF", "FT", "gr"))
@@ -742,124 +1002,9 @@ def test_variants() -> None:
     m = b.lookup_variants("borgarstjórn", "kk", ("EF", "FT", "nogr"))
     assert not m
 
-    m = b.lookup_variants("fór", "so", ("VH", "ÞT"), lemma="fara")
-    assert m[0].bmynd == "færi" and all("VH" in mm.mark and "ÞT" in mm.mark for mm in m)
-    m = b.lookup_variants("fór", "so", ("VH", "NT"), lemma="fara")
-    assert m[0].bmynd == "fari" and all("VH" in mm.mark and "NT" in mm.mark for mm in m)
-    m = b.lookup_variants(
-        "fór",
-        "so",
-        ("VH", "FT", "NT", "1P"),
-        lemma="fara",
-        inflection_filter=lambda b: "OP" not in b,
-    )
-    assert m[0].bmynd == "förum" and all(
-        all(x in mm.mark for x in ("VH", "FT", "NT", "1P")) and "OP" not in mm.mark
-        for mm in m
-    )
-    m = b.lookup_variants(
-        "fór",
-        "so",
-        ("VH", "FT", "ÞT", "1P"),
-        lemma="fara",
-        inflection_filter=lambda b: "OP" not in b,
-    )
-    assert m[0].bmynd == "færum" and all(
-        all(x in mm.mark for x in ("VH", "FT", "ÞT", "1P")) and "OP" not in mm.mark
-        for mm in m
-    )
-    m = b.lookup_variants(
-        "fór",
-        "so",
-        ("vh", "ft", "þt", "p1"),
-        lemma="fara",
-        inflection_filter=lambda b: "OP" not in b,
-    )
-    assert m[0].bmynd == "færum" and all(
-        all(x in mm.mark for x in ("VH", "FT", "ÞT", "1P")) and "OP" not in mm.mark
-        for mm in m
-    )
-    m = b.lookup_variants("fór", "so", ("NT",), lemma="fara")
-    assert m[0].bmynd == "fer" and all("NT" in mm.mark for mm in m)
-    m = b.lookup_variants("fór", "so", ("MM",), lemma="fara")
-    assert m[0].bmynd == "fórst" and all("MM" in mm.mark for mm in m)
-    m = b.lookup_variants("fór", "so", ("MM", "NT"), lemma="fara")
-    assert m[0].bmynd == "ferst" and all(
-        all(x in mm.mark for x in ("MM", "NT")) for mm in m
-    )
-    m = b.lookup_variants(
-        "fór",
-        "so",
-        ("MM", "NT", "2P", "FT"),
-        lemma="fara",
-        inflection_filter=lambda b: "OP" not in b,
-    )
-    assert m[0].bmynd == "farist" and all(
-        all(x in mm.mark for x in ("MM", "NT", "2P", "FT")) and "OP" not in mm.mark
-        for mm in m
-    )
-    m = b.lookup_variants(
-        "fór",
-        "so",
-        ("MM", "NT", "p2", "FT"),
-        lemma="fara",
-        inflection_filter=lambda b: "OP" not in b,
-    )
-    assert m[0].bmynd == "farist" and all(
-        all(x in mm.mark for x in ("MM", "NT", "2P", "FT")) and "OP" not in mm.mark
-        for mm in m
-    )
-    m = b.lookup_variants("skrifar", "so", ("ÞT", "1P"))
-    assert m[0].bmynd == "skrifaði" and all(
-        all(x in mm.mark for x in ("ÞT", "1P")) for mm in m
-    )
-
-    m = b.lookup_variants("skrifar", "so", ("ÞT", "2P"))
-    assert m[0].bmynd == "skrifaðir" and all(
-        all(x in mm.mark for x in ("ÞT", "2P")) for mm in m
-    )
-    m = b.lookup_variants("skrifuðu", "so", ("FH", "ET", "NT"))
-    assert m[0].bmynd == "skrifar" and all(
-        all(x in mm.mark for x in ("FH", "ET", "NT")) for mm in m
-    )
     m = b.lookup_variants("skrifuðu", "so", "LHNT")
     assert m[0].bmynd == "skrifandi" and m[0].mark == "LHNT" and len(m) == 1
 
-    m = b.lookup_variants("fallegur", "lo", "MST")
-    assert m[0].bmynd == "fallegri" and all("MST" in mm.mark for mm in m)
-    m = b.lookup_variants("fallegur", "lo", ("MST", "HK"))
-    assert m[0].bmynd == "fallegra" and all(
-        all(x in mm.mark for x in ("MST", "HK")) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", ("MST", "KVK"))
-    assert m[0].bmynd == "fallegri" and all(
-        all(x in mm.mark for x in ("MST", "KVK")) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", "EVB")
-    assert m[0].bmynd == "fallegasti" and all(
-        all(x in mm.mark for x in ("EVB",)) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", "ESB")
-    assert m[0].bmynd == "fallegastur" and all(
-        all(x in mm.mark for x in ("ESB",)) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", ("EVB", "KVK"))
-    assert m[0].bmynd == "fallegasta" and all(
-        all(x in mm.mark for x in ("EVB", "KVK")) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", ("ESB", "KVK"))
-    assert m[0].bmynd == "fallegust" and all(
-        all(x in mm.mark for x in ("ESB", "KVK")) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", ("EVB", "HK"))
-    assert m[0].bmynd == "fallegasta" and all(
-        all(x in mm.mark for x in ("EVB", "HK")) for mm in m
-    )
-    m = b.lookup_variants("fallegur", "lo", ("ESB", "HK"))
-    assert m[0].bmynd == "fallegast" and all(
-        all(x in mm.mark for x in ("ESB", "HK")) for mm in m
-    )
-
     m = b.lookup_variants("höfuðborgarstjórnarmeirihluti", "kk", ("ÞF", "FT", "gr"))
     assert len(m) == 1
     assert m[0].bmynd == "höfuð-borgarstjórnar-meirihlutana"
@@ -950,15 +1095,15 @@ def test_variants() -> None:
     )
 
 
-def test_sorting() -> None:
-    b = Bin()
+def test_sorting(bin_db: Bin) -> None:
+    b = bin_db
     _, r = b.lookup_ksnid("arfa")
     assert r[0].ofl == "kk"
     assert r[-1].ofl == "kvk"
 
 
-def test_id() -> None:
-    b = Bin()
+def test_id(bin_db: Bin) -> None:
+    b = bin_db
 
     k = b.lookup_id(495410)
     assert len(k) == 1
@@ -974,17 +1119,18 @@ def test_id() -> None:
 
     k = b.lookup_id(416784)  # 'köttur'
     assert len(k) == 17
-    assert all(item.bin_id == 416784 for item in k)
-    assert all(item.ord == "köttur" for item in k)
-    assert all(item.ofl == "kk" for item in k)
+    assert all(
+        item.bin_id == 416784 and item.ord == "köttur" and item.ofl == "kk"
+        for item in k
+    )
 
     assert b.lookup_id(-100) == []  # No such bin_id
     assert b.lookup_id(77) == []  # No such bin_id
     assert b.lookup_id(1000000) == []  # No such bin_id
 
 
-def test_ksnid() -> None:
-    b = Bin()
+def test_ksnid(bin_db: Bin) -> None:
+    b = bin_db
 
     k, m = b.lookup_ksnid("Vísindavefsins")
     assert k == "Vísindavefsins"
@@ -1027,12 +1173,28 @@ def test_ksnid() -> None:
 
 if __name__ == "__main__":
 
-    test_lookup()
-    test_bin()
-    test_bindb()
-    test_compounds()
-    test_legur()
-    test_casting()
-    test_forms()
-    test_sorting()
-    test_id()
+    bc, db, gdb = BinCompressed(), Bin(), GreynirBin()
+    test_lookup(bc)
+    test_bin(bc)
+    for case_args in CASE_FORMS_CASES:
+        test_case_forms(bc, *case_args)
+    for declension_args in DECLENSION_CASES:
+        test_declension(bc, *declension_args)
+    test_bindb(gdb)
+    test_compounds(db)
+    test_navigate()
+    db_no_legur = Bin(add_legur=False)
+    for word in LEGUR_FORMS:
+        test_legur(db, word)
+        test_no_legur(db_no_legur, word)
+        test_legur_greynir(gdb, word)
+    for cast_args in CAST_CASES:
+        test_cast(db, *cast_args)
+    test_casting(db)
+    test_forms(db)
+    for variant_args in VARIANT_CASES:
+        test_variant(db, *variant_args)
+    for forms_args in FORMS_CASES:
+        test_forms_case(db, *forms_args)
+    test_sorting(db)
+    test_id(db)
@@ -30,6 +30,8 @@
 
 """
 
+import pytest
+
 from islenska import Orð
 
 
@@ -44,19 +46,16 @@ def test_ord() -> None:
     assert f"Ég er að {o} {b:ÞF-gr}" == "Ég er að lesa bókina"
     assert f"Ég er að {o} {b:ÞF-nogr}" == "Ég er að lesa bók"
     assert f"Ég er að {o} {b:ÞF-FT-nogr}" == "Ég er að lesa bækur"
+    assert b.form("þf_gr") == "bókina"
+    assert b.form("ÞF-FT-nogr") == "bækur"
+    assert b.form("") == "bók"
     assert f"Ég er að {o:nh} bókina" == "Ég er að lesa bókina"
     assert f"Ég er að {o:nh-nt} bókina" == "Ég er að lesa bókina"
     assert f"Ég er að {o:nh-ft} bókina" == "Ég er að lesa bókina"
-    try:
-        if f"Ég er að {o:nh-xx} bókina" == "Ég er að lesa bókina":
-            assert False
-    except ValueError:
-        pass
-    try:
-        if f"Ég er að {o:nh_xx} bókina" == "Ég er að lesa bókina":
-            assert False
-    except ValueError:
-        pass
+    with pytest.raises(ValueError):
+        format(o, "nh-xx")
+    with pytest.raises(ValueError):
+        format(o, "nh_xx")
 
     assert f"Ég hef {o:sagnb} bókina" == "Ég hef lesið bókina"
 
@@ -146,3 +145,14 @@ def test_ord() -> None:
     b = Orð("draumsýn")
     assert f"{g:kvk_nf} {l:kvk_fvb_et} {b:nf_et}" == "Hin íslenska draumsýn"
     assert f"{g:kvk_nf_ft} {l:kvk_fvb_ft} {b:nf_ft}" == "Hinar íslensku draumsýnir"
+
+
+def test_from_ksnid() -> None:
+
+    b = Orð("bók")
+    assert b.entries
+    o = Orð.from_ksnid(b.entries[0])
+    assert o.word == "bók"
+    assert o.entries == [b.entries[0]]
+    assert f"Ég er að lesa {o:þf_gr}" == "Ég er að lesa bókina"
+    assert f"Ég er að lesa {o:þf-ft-nogr}" == "Ég er að lesa bækur"
@@ -140,6 +140,7 @@ import os
 import io
 import time
 import struct
+from bisect import bisect_left
 from collections import defaultdict
 
 from islenska.basics import (
@@ -200,103 +201,108 @@ class _Node:
 
     """A Node within a Trie"""
 
+    __slots__ = ("fragment", "value", "children", "child_firsts")
+
     def __init__(self, fragment: bytes, value: Any) -> None:
         # The key fragment that leads into this node (and value)
         self.fragment = fragment
         self.value = value
         # List of outgoing nodes
         self.children: Optional[List[_Node]] = None
+        # The first byte of each child's fragment, in the same order
+        # as the children list, for a fast binary search
+        self.child_firsts: Optional[bytearray] = None
 
     def add(self, fragment: bytes, value: Any) -> Any:
         """Add the given remaining key fragment to this node"""
-        if len(fragment) == 0:
-            if self.value is not None:
-                # This key already exists: return its value
-                return self.value
-            # This was previously an internal node without value;
-            # turn it into a proper value node
-            self.value = value
-            return None
-
-        if self.children is None:
-            # Trivial case: add an only child
-            self.children = [_Node(fragment, value)]
-            return None
-
-        # Check whether we need to take existing child nodes into account
-        lo = mid = 0
-        hi = len(self.children)
-        ch = fragment[0]
-        while hi > lo:
-            mid = (lo + hi) // 2
-            mid_ch = self.children[mid].fragment[0]
-            if mid_ch < ch:
-                lo = mid + 1
-            elif mid_ch > ch:
-                hi = mid
+        # Walk down the trie iteratively, rather than recursively,
+        # since this is called for every entry when building the trie
+        node = self
+        while True:
+            len_fragment = len(fragment)
+            if len_fragment == 0:
+                if node.value is not None:
+                    # This key already exists: return its value
+                    return node.value
+                # This was previously an internal node without value;
+                # turn it into a proper value node
+                node.value = value
+                return None
+
+            children = node.children
+            ch = fragment[0]
+            if children is None:
+                # Trivial case: add an only child
+                node.children = [_Node(fragment, value)]
+                node.child_firsts = bytearray((ch,))
+                return None
+
+            # Check whether we need to take existing child nodes into account
+            child_firsts = node.child_firsts
+            assert child_firsts is not None
+            mid = bisect_left(child_firsts, ch)
+            if mid == len(child_firsts) or child_firsts[mid] != ch:
+                # No common prefix with any child:
+                # simply insert a new child into the sorted list
+                children.insert(mid, _Node(fragment, value))
+                child_firsts.insert(mid, ch)
+                return None
+
+            # Found a child with at least one common prefix character
+            child = children[mid]
+            child_fragment = child.fragment
+            # assert child_fragment[0] == ch
+            # Count the number of common prefix characters
+            common = 1
+            len_child_fragment = len(child_fragment)
+            while (
+                common < len_fragment
+                and common < len_child_fragment
+                and fragment[common] == child_fragment[common]
+            ):
+                common += 1
+            if common == len_child_fragment:
+                # We have 'abcd' but the child is 'ab':
+                # Continue by adding the remaining 'cd' fragment to the child
+                node = child
+                fragment = fragment[common:]
+                continue
+            # Here we can have two cases:
+            # either the fragment is a proper prefix of the child,
+            # or the two diverge after #common characters
+            # assert common < len_child_fragment
+            # assert common <= len_fragment
+            # We have 'ab' but the child is 'abcd',
+            # or we have 'abd' but the child is 'acd'
+            child.fragment = child_fragment[common:]  # 'cd'
+            if common == len_fragment:
+                # The fragment is a proper prefix of the child,
+                # i.e. it is 'ab' while the child is 'abcd':
+                # Break the child up into two nodes, 'ab' and 'cd'
+                new_node = _Node(fragment, value)  # New parent 'ab'
+                new_node.children = [child]  # Make 'cd' a child of 'ab'
+                new_node.child_firsts = bytearray((child.fragment[0],))
             else:
-                break
-
-        if hi == lo:
-            # No common prefix with any child:
-            # simply insert a new child into the sorted list
-            # if lo > 0:
-            #     assert self._children[lo - 1]._fragment[0] < fragment[0]
-            # if lo < len(self._children):
-            #     assert self._children[lo]._fragment[0] > fragment[0]
-            self.children.insert(lo, _Node(fragment, value))
+                # The fragment and the child diverge,
+                # i.e. we have 'abd' but the child is 'acd'
+                new_fragment = fragment[common:]  # 'bd'
+                # Make an internal node without a value
+                new_node = _Node(fragment[0:common], None)  # 'a'
+                # assert new_fragment[0] != child.fragment[0]
+                new_ch, child_ch = new_fragment[0], child.fragment[0]
+                if new_ch < child_ch:
+                    # Children: 'bd', 'cd'
+                    new_node.children = [_Node(new_fragment, value), child]
+                    new_node.child_firsts = bytearray((new_ch, child_ch))
+                else:
+                    new_node.children = [child, _Node(new_fragment, value)]
+                    new_node.child_firsts = bytearray((child_ch, new_ch))
+            # Replace 'abcd' in the original children list
+            # (the first byte of the fragment, 'a', stays the same,
+            # so child_firsts needs no update)
+            children[mid] = new_node
             return None
 
-        assert hi > lo
-        # Found a child with at least one common prefix character
-        # noinspection PyUnboundLocalVariable
-        child = self.children[mid]
-        child_fragment = child.fragment
-        # assert child_fragment[0] == ch
-        # Count the number of common prefix characters
-        common = 1
-        len_fragment = len(fragment)
-        len_child_fragment = len(child_fragment)
-        while (
-            common < len_fragment
-            and common < len_child_fragment
-            and fragment[common] == child_fragment[common]
-        ):
-            common += 1
-        if common == len_child_fragment:
-            # We have 'abcd' but the child is 'ab':
-            # Recursively add the remaining 'cd' fragment to the child
-            return child.add(fragment[common:], value)
-        # Here we can have two cases:
-        # either the fragment is a proper prefix of the child,
-        # or the two diverge after #common characters
-        # assert common < len_child_fragment
-        # assert common <= len_fragment
-        # We have 'ab' but the child is 'abcd',
-        # or we have 'abd' but the child is 'acd'
-        child.fragment = child_fragment[common:]  # 'cd'
-        if common == len_fragment:
-            # The fragment is a proper prefix of the child,
-            # i.e. it is 'ab' while the child is 'abcd':
-            # Break the child up into two nodes, 'ab' and 'cd'
-            node = _Node(fragment, value)  # New parent 'ab'
-            node.children = [child]  # Make 'cd' a child of 'ab'
-        else:
-            # The fragment and the child diverge,
-            # i.e. we have 'abd' but the child is 'acd'
-            new_fragment = fragment[common:]  # 'bd'
-            # Make an internal node without a value
-            node = _Node(fragment[0:common], None)  # 'a'
-            # assert new_fragment[0] != child._fragment[0]
-            if new_fragment[0] < child.fragment[0]:
-                # Children: 'bd', 'cd'
-                node.children = [_Node(new_fragment, value), child]
-            else:
-                node.children = [child, _Node(new_fragment, value)]
-        # Replace 'abcd' in the original children list
-        self.children[mid] = node
-        return None
-
     def lookup(self, fragment: bytes) -> Any:
         """Lookup the given key fragment in this node and its children
         as necessary"""